@@ -0,0 +1,191 @@
+import os
+import json
+import time
+import platform
+import subprocess
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+# Frame counts for the step-5 frequency benchmark
+FREQUENCY_SIZES = [1_000_000, 10_000_000, 50_000_000]
+
+# Micro-batch sizes for the flat-predictor latency benchmark
+BATCH_SIZES = [1, 8, 64, 512, 4096]
+
+# Frame counts for the end-to-end pipeline suite
+SUITE_SIZES = [1_000_000, 10_000_000, 100_000_000]
+
+# Fixed generator seed and model params so runs are comparable across commits
+SUITE_SEED   = 0
+SUITE_PARAMS = {'n_estimators': 100, 'max_depth': 20, 'random_state': 0}
+
+# Timed repetitions per measurement (best-of)
+REPEAT = 3
+
+RESULT_PATH = os.path.join("report", "benchmark")
+INPUT_PATH  = os.path.join("source", "benchmark")   # cached synthetic captures
+
+
+# ── Synthetic Input ───────────────────────────────────────────────────────────
+
+def make_frames(n_frames, seed=0):
+    """
+    Build a minimal synthetic capture for step-5 timing.
+
+    Raw frames from synthetic.generate_blocks(n_frames, seed), reduced to
+    Arbitration_ID (int), Data (int), DateTime (datetime64[ns]).
+    """
+    pass
+
+
+def capture_path(n_frames, seed=SUITE_SEED):
+    """
+    Cached raw capture for a suite size:
+      {INPUT_PATH}/synthetic_{n_frames}_{seed}_v{GENERATOR_VERSION}.csv
+    Generated with synthetic.generate_capture() on first use only.
+    """
+    pass
+
+
+# ── Benchmarks ────────────────────────────────────────────────────────────────
+
+def time_call(fn, *args, repeat=REPEAT):
+    """ Return the best wall-clock time (seconds) of fn(*args) over `repeat` runs. """
+    pass
+
+
+def benchmark_frequency_backends(sizes=FREQUENCY_SIZES):
+    """
+    Compare processing() step 5 backends on synthetic frames.
+
+    For each size in sizes:
+      1. frames = make_frames(size)
+      2. t_rolling      = time_call(step-5 with frequency_backend='rolling')
+      3. t_searchsorted = time_call(step-5 with frequency_backend='searchsorted')
+      4. Check ID_Frequency / Data_Frequency / Frequency_diff are bit-identical
+           np.array_equal(rolling_out, searchsorted_out)
+      5. Record rows/s for each backend and speedup = t_rolling / t_searchsorted
+
+    Returns a list of dicts: size, backend, seconds, rows_per_sec, speedup.
+    """
+    pass
+
+
+def benchmark_flat_predictor(model, X, batch_sizes=BATCH_SIZES):
+    """
+    Micro-batch latency: model.predict vs flattree.predict_flat.
+
+    1. forest = export_model(model); verify_flat(model, forest, X)
+    2. For each batch size b:
+         - draw batches of b rows from X
+         - time model.predict(batch) and predict_flat(forest, batch)
+         - record median / p99 latency per call and rows/s
+    Returns a list of dicts: batch_size, predictor, p50_us, p99_us, rows_per_sec.
+    """
+    pass
+
+
+def benchmark_model_load(pickle_path, store_path, repeat=REPEAT):
+    """
+    Load time: pickle.load vs modelstore.load_store (mmap).
+
+    Each measurement runs in a fresh subprocess so the unpickled objects
+    are not reused, for both cold (after dropping the file from the page
+    cache when permitted) and warm reads.
+    Also records resident memory after load (RSS delta).
+    Returns a list of dicts: format, cache, seconds, rss_mb.
+    """
+    pass
+
+
+def benchmark_suite(sizes=SUITE_SIZES):
+    """
+    End-to-end pipeline timing on synthetic captures.
+
+    For each size (train and test captures from capture_path, seeds differ):
+      processing     : processing() on the raw capture (rows/s)
+      filter_train   : observation1/2 filter_train() on the proc frame
+      filter_test    : filter_test()
+      train          : RF with SUITE_PARAMS on the filtered train set
+      predict        : model.predict on the filtered test set (rows/s)
+    Each stage is timed with time_call() (best of REPEAT); 100M-frame
+    stages that exceed memory are recorded as skipped, not dropped.
+
+    Returns {'run': run_metadata(), 'results': [...]} .
+    """
+    pass
+
+
+def run_metadata():
+    """
+    Fields that make runs comparable across commits:
+    git commit (git rev-parse HEAD), dirty flag, date, hostname,
+    platform.processor(), cpu count, python / numpy / pandas / sklearn /
+    xgboost versions, GENERATOR_VERSION, SUITE_SEED, SUITE_PARAMS.
+    """
+    pass
+
+
+def compare_runs(base_path, new_path, tolerance=0.10):
+    """
+    Compare two suite JSON files stage by stage.
+    Prints seconds and the relative change per (size, stage); flags
+    slowdowns above tolerance.
+    """
+    pass
+
+
+def benchmark_filters(proc_path):
+    """
+    Peak memory and time of the observation 1/2 filters, before and after.
+
+    before : ids.py chain — df[Label == 4] → [ID >= 1792], df[ID < 1792],
+             concat, then [Label != 5]  (full-width intermediate frames)
+    after  : filters.apply(df, TRAIN_FILTER, columns=FEATURE_COLS + ['Label'])
+             and filters.scan(proc_path, TRAIN_FILTER, columns=...)
+    Peak memory per variant from tracemalloc (NumPy / pandas buffers are
+    traced) in a fresh subprocess, plus ru_maxrss.
+    Checks the selected row sets are identical.
+    Returns a list of dicts: variant, seconds, peak_mb, rows.
+    """
+    pass
+
+
+def benchmark_routing(train_path, test_path):
+    """
+    Routed vs monolithic inference (routing.compare_monolithic).
+    Records rows/s, accuracy and macro F1 for both, and the share of
+    test frames settled by the period table and each group model.
+    Returns a list of dicts: predictor, rows_per_sec, accuracy, f1_macro, share_*.
+    """
+    pass
+
+
+def save_results(results, name):
+    """ Write benchmark results to {RESULT_PATH}/{name}.csv. """
+    pass
+
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+def main():
+    """
+    Execution flow:
+
+    1. benchmark_frequency_backends()
+    2. Print table: size × backend → seconds / rows/s / speedup
+    3. benchmark_flat_predictor() for clf_C / clf_S of a trained IDSModel
+    4. Print table: batch size × predictor → p50 / p99 latency
+    5. benchmark_model_load() for {name}_C.pkl vs {name}_C.store
+       benchmark_filters() on the synthetic train proc file
+       benchmark_routing() on the synthetic train / test proc files
+    6. save_results()
+    7. benchmark_suite() → report/benchmark/suite_{commit}.json
+       (compare_runs() against a previous commit's file)
+    """
+    pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import os
+import pandas as pd
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+# Feature columns from preprocessing.py — the single definition, imported by
+# observation1/2/3, online and routing
+FEATURE_COLS = [
+    'Arbitration_ID', 'DLC',
+    'Prev_Interver', 'ID_Prev_Interver', 'Data_Prev_Interver',
+    'ID_Frequency', 'Data_Frequency', 'Frequency_diff'
+]
+
+# Compact schema — the single definition; preprocessing.save_proc() writes with it
+PROC_DTYPES = {
+    'Arbitration_ID'    : 'uint16',
+    'DLC'               : 'uint8',
+    'Label'             : 'uint8',
+    'Prev_Interver'     : 'float32',
+    'ID_Prev_Interver'  : 'float32',
+    'Data_Prev_Interver': 'float32',
+    'ID_Frequency'      : 'uint32',
+    'Data_Frequency'    : 'uint32',
+    'Frequency_diff'    : 'uint32',
+    'Payload_Hamming'   : 'uint8',
+    'Bytes_Changed'     : 'uint8',
+    'Hamming_Mean'      : 'float32',
+    'Payload_Repeat'    : 'uint8',
+    'Sequence_Repeat'   : 'uint8',
+}
+
+# Payload sequence features (preprocessing --sequence-depth N); optional
+SEQUENCE_COLS = ['Payload_Hamming', 'Bytes_Changed', 'Hamming_Mean', 'Payload_Repeat', 'Sequence_Repeat']
+
+# Step-5 feature names; window-suffixed variants (ID_Frequency_1s, …) share them
+FREQUENCY_PREFIXES = ['ID_Frequency', 'Data_Frequency', 'Frequency_diff']
+
+# Requested columns that may legitimately be missing from a split:
+# SEQUENCE_COLS (SEQUENCE_DEPTH = 0) and Interface (dropped by processing() step 6)
+OPTIONAL_COLS = SEQUENCE_COLS + ['Interface']
+
+
+# ── Schema ────────────────────────────────────────────────────────────────────
+
+def resolve_feature_cols(columns):
+    """
+    Expand FEATURE_COLS to the feature columns actually present.
+
+    columns: a DataFrame, a Parquet schema's names, or any list of column names.
+
+    Non-frequency FEATURE_COLS are kept as-is. Each FREQUENCY_PREFIXES
+    entry is replaced by every column equal to it or named
+    f"{prefix}_{window}", in column order — so features from
+    preprocessing WINDOW_SIZES are picked up without editing FEATURE_COLS.
+    SEQUENCE_COLS present are appended.
+
+    Every place that selects model features (observation1/2/3 filters and
+    extract_features(), online, routing, featurestore, tuning) uses this
+    list, so training and inference always see the same columns.
+    """
+    pass
+
+
+def project_columns(available, columns):
+    """
+    Resolve a requested projection against the columns a split really has.
+
+      available : column names of the file schema or DataFrame
+      columns   : requested names; None → every available column
+
+    A FREQUENCY_PREFIXES name expands to itself and its window-suffixed
+    variants present in available; OPTIONAL_COLS absent from available are
+    skipped; any other missing name raises KeyError.
+    Returns the list of names to read, in requested order.
+
+    load_proc() and FeatureCache.get_or_compute() both project with this,
+    so a cache miss, a cache hit and a proc file return the same columns.
+    """
+    pass
+
+
+def proc_dtypes(columns):
+    """
+    PROC_DTYPES restricted to the given columns, plus 'uint32' for every
+    window-suffixed FREQUENCY_PREFIXES column (ID_Frequency_1s, …).
+    Used for every cast to the compact schema, so multi-window output is
+    never left as float64.
+    """
+    pass
+
+
+# ── Loading ───────────────────────────────────────────────────────────────────
+
+def load_proc(path, columns=None, memory_map=True):
+    """
+    Load one preprocessed split (train_proc / test_proc).
+
+    path    : .parquet or .csv file
+    columns : column projection; None loads every column
+              project_columns(file schema, columns): a FREQUENCY_PREFIXES
+              name also selects its window-suffixed variants present in the
+              file (multi-window output); OPTIONAL_COLS the file does not
+              contain are skipped
+
+    .parquet : pyarrow.parquet.read_table(path, columns=columns,
+                                          memory_map=memory_map).to_pandas()
+               Only the projected column chunks are read; with memory_map
+               the pages are mapped instead of copied into Python buffers.
+    .csv     : pd.read_csv(path, usecols=columns)
+               Fallback for files written by the original CSV output.
+               Dtypes are left as read (float64 intervals / frequencies),
+               so training inputs match the original CSV pipeline.
+
+    Parquet returns proc_dtypes(columns) dtypes (suffixed frequency columns → uint32).
+    CSV returns pandas' default dtypes.
+    """
+    pass
+
+
+def load_split(raw_dir, cache, columns=None):
+    """
+    Load one split from its raw label CSVs through the feature cache.
+
+    For each *label*.csv in sorted(os.listdir(raw_dir)):
+      cache.get_or_compute(path, params, compute=read_csv + processing(),
+                           columns=columns)
+    Concatenate in file order — same rows as {split}_proc.
+    """
+    pass
+
+
+def load_data(train_path, test_path, columns=None, cache=None):
+    """
+    Shared load_data() for observation1/2/3.
+
+    train_path / test_path:
+      proc file (.csv / .parquet) → load_proc() on both splits
+      raw split directory         → load_split() with cache
+                                    (featurecache.FeatureCache)
+    Both splits use the same projection.
+    Observations pass columns = FEATURE_COLS + SEQUENCE_COLS + ['Label']
+    (+ 'Interface' for per-bus work); load_proc() expands the frequency
+    names to the suffixed variants in the file, and extract_features()
+    selects resolve_feature_cols(df).
+    Returns train_df, test_df.
+    """
+    pass
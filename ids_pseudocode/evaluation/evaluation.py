@@ -0,0 +1,229 @@
+import os
+import numpy as np
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+BUSES = ['B-CAN', 'C-CAN', 'P-CAN']
+
+LABEL_MAP = {
+    0: 'Normal', 1: 'DoS', 2: 'Spoofing',
+    3: 'Replay',  4: 'Fuzzing',  5: 'UDS_Spoofing'
+}
+
+# Arbitration_ID threshold for UDS diagnostic range (0x700 = 1792)
+UDS_ID_THRESHOLD = 1792
+
+# Arbitration_ID ranges used as report groups (lower bound inclusive)
+#   0x000–0x6FF : periodic ECU traffic, split into 0x100-wide bands
+#   0x700–0x7FF : UDS diagnostic range
+ID_RANGE_EDGES = [0x000, 0x100, 0x200, 0x300, 0x400, 0x500, 0x600, UDS_ID_THRESHOLD, 0x800]
+
+# Test rows per batch (one batch of features + predictions resident at a time)
+BATCH_SIZE = 1_000_000
+
+
+# ── Batches ───────────────────────────────────────────────────────────────────
+
+def iter_batches(source, columns, batch_size=BATCH_SIZE, predicate=None):
+    """
+    Yield the test set as DataFrames of at most batch_size rows, in file order.
+
+    source may be:
+      .parquet      → pyarrow.parquet.ParquetFile(path).iter_batches(
+                        batch_size, columns=columns)  (one row group resident)
+      .csv          → pd.read_csv(path, usecols=columns, chunksize=batch_size)
+                        (dtypes as written, same as dataio.load_proc)
+      FeatureStore  → the store lays rows out by (split, bus), so batches
+                        follow file order instead:
+                          order = store.original_order('test')
+                          idx   = order[start:start + batch_size]
+                        X[idx] plus label / arb_id / interface[idx] as a
+                        DataFrame (one batch copied at a time)
+
+    predicate: test filter applied per batch, so the filtered test set is
+    never materialized whole — filters.apply(batch, predicate) for file
+    batches, predicate.mask_arrays({'Label': label[idx],
+    'Arbitration_ID': arb_id[idx]}) on the store's index arrays (before X
+    is gathered, so dropped rows are never copied). Observation 1/2 pass
+    filters.TEST_FILTER; None (observation 3) keeps every row, including
+    UDS_Spoofing, so batched metrics match the unbatched run.
+    Every batch carries its global row offset for the labeled output.
+    """
+    pass
+
+
+def group_index(arb_id, interface=None):
+    """
+    Group code per row: bus_slot * n_ranges + range_index, always in
+    0 … (n_buses + 1) * n_ranges - 1, so np.bincount never sees a negative.
+
+      range_index = np.searchsorted(ID_RANGE_EDGES, arb_id, side='right') - 1
+                    clipped to 0 … n_ranges - 1 (IDs >= 0x800, e.g. extended
+                    IDs, fall into the last range instead of index 8)
+      bus_index   = BUSES index of Interface; -1 when Interface is absent
+                    (or not one of BUSES), the same sentinel as
+                    observation2 cache_scores()
+      bus_slot    = np.where(bus_index < 0, n_buses, bus_index)
+
+    Slot n_buses is the accumulator's "no bus" slot: those rows count toward
+    the overall and ID-range matrices but toward no bus, so a frame without
+    Interface is never reported as B-CAN.
+    Vectorized over the batch; no per-row Python.
+    """
+    pass
+
+
+# ── Confusion Accumulator ─────────────────────────────────────────────────────
+
+class ConfusionAccumulator:
+    """
+    Confusion matrices for every (bus, ID range) group, built batch by batch.
+
+    counts: int64 array (n_buses + 1, n_ranges, n_classes, n_classes)
+            counts[b, r, true, pred]; b = n_buses is the "no bus" slot
+            for rows without Interface (group_index() bus -1)
+
+    One update per batch, for all groups at once:
+      flat = ((g * K) + y_true) * K + y_pred        (g = group_index(), K = n_classes)
+      counts.ravel()[:] += np.bincount(flat, minlength=counts.size)
+
+    Memory is independent of the test-set size: (3 + 1) × 8 × 6 × 6 counters
+    (8 ID ranges between the 9 ID_RANGE_EDGES).
+    Per-label results are the matrix rows; per-bus / per-range / overall
+    matrices are sums over the other axes — no re-masking of the data.
+    """
+
+    def __init__(self, n_classes, n_buses=len(BUSES), n_ranges=len(ID_RANGE_EDGES) - 1):
+        pass
+
+    def update(self, y_true, y_pred, arb_id, interface=None):
+        """ Add one batch (NumPy arrays of equal length). """
+        pass
+
+    def matrix(self, bus=None, id_range=None):
+        """
+        (n_classes, n_classes) confusion matrix for a bus, an ID range
+        index, both, or the whole test set (None = sum over that axis).
+        bus=None includes the "no bus" slot; bus=b (0 … n_buses-1) never does.
+        """
+        pass
+
+    def merge(self, other):
+        """ counts += other.counts — combine accumulators from parallel workers. """
+        pass
+
+    def save(self, path):
+        """ np.savez(path, counts=…, edges=ID_RANGE_EDGES) — reports can be rebuilt later. """
+        pass
+
+
+# ── Reports ───────────────────────────────────────────────────────────────────
+
+def metrics_from_matrix(cm):
+    """
+    Per-class precision / recall / F1 / support from a confusion matrix.
+
+      tp        = diag(cm)
+      precision = tp / cm.sum(axis=0)
+      recall    = tp / cm.sum(axis=1)
+      f1        = 2 · precision · recall / (precision + recall)
+      support   = cm.sum(axis=1)
+    Zero denominators give 0.0 (sklearn zero_division=0).
+    Also returns accuracy, macro avg and weighted avg.
+    """
+    pass
+
+
+def classification_report(cm, target_names, digits=4):
+    """
+    Text report in the same layout and values as
+    sklearn.metrics.classification_report(y_true, y_pred,
+        labels=range(len(target_names)), target_names=target_names,
+        digits=digits, zero_division=0)
+    computed from the matrix alone.
+    """
+    pass
+
+
+def grouped_reports(acc, target_names):
+    """
+    Reports for every group in one call:
+      'overall'            → acc.matrix()
+      'bus/{bus}'          → acc.matrix(bus=b)   (only buses with rows —
+                              none when the test set has no Interface)
+      'range/{lo:03X}-{hi:03X}' → acc.matrix(id_range=r)
+    Returns {group: (matrix, metrics)} — groups without rows are omitted.
+    """
+    pass
+
+
+# ── Labeled Output ────────────────────────────────────────────────────────────
+
+class LabeledWriter:
+    """
+    Incremental {name}_labeled.csv writer.
+
+    write(batch_df, pred_class, pred_subclass) appends Predict_Class and
+    Predict_Label (label_map name) to the batch and writes it with
+    to_csv(mode='a', header=first_batch). Rows arrive in file order, so
+    the output is identical to save_labeled_csv() on the whole test set.
+
+    label_map is the caller's map (observation2 names class 1 'Flooding',
+    observation1/3 'DoS'); LABEL_MAP here is only the default.
+    """
+
+    def __init__(self, path, label_map=LABEL_MAP):
+        pass
+
+    def write(self, batch_df, pred_class, pred_subclass):
+        pass
+
+    def close(self):
+        pass
+
+
+# ── Evaluation Engine ─────────────────────────────────────────────────────────
+
+def evaluate_stream(predict_fn, batches, n_classes=2, n_subclasses=len(LABEL_MAP),
+                    labeled_path=None, label_map=LABEL_MAP):
+    """
+    One pass over the test batches.
+
+    predict_fn(X) → (pred_class, pred_subclass); e.g. both classifiers,
+    observation1/2 cascade_predict(), or a single CANIDSModel.predict
+    (pred_class = None).
+
+    n_classes    : classes of the binary accumulator (Normal / Attack)
+    n_subclasses : classes of the subclass accumulator (5 for observation
+                   1/2 after TEST_FILTER, 6 for observation3)
+    label_map    : passed to LabeledWriter (the caller's LABEL_MAP)
+
+    For each batch from iter_batches():
+      1. X = batch[feature_cols].to_numpy(np.float32)
+         (feature_cols = dataio.resolve_feature_cols(first batch))
+         arb_id    = batch['Arbitration_ID'] (raw integer IDs)
+         interface = batch['Interface'] if present, else None
+         — both read before any scaling; predict_fn applies the scaler
+      2. pred_class, pred_subclass = predict_fn(X)
+      3. acc_class.update(Label != 0, pred_class, arb_id, interface)
+           — skipped when predict_fn returns pred_class None (observation3);
+             acc_class is then never created
+         acc_sub.update(Label, pred_subclass, arb_id, interface)
+      4. LabeledWriter(labeled_path, label_map).write(batch, ...) if labeled_path
+      5. Drop the batch
+
+    Returns acc_class (None without pred_class), acc_sub and rows processed.
+    Peak memory ≈ one batch + its predictions + the model.
+    """
+    pass
+
+
+def save_reports(acc, target_names, name, report_dir):
+    """
+    Write {name} report.txt (overall) and {name} grouped report.txt
+    (bus / ID range sections) from grouped_reports(), plus
+    {name}_confusion.npz via acc.save(). The overall confusion matrix
+    plot uses acc.matrix() as before.
+    """
+    pass
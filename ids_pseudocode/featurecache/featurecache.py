@@ -0,0 +1,100 @@
+import os
+import json
+import hashlib
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+CACHE_DIR       = os.path.join("source", "AutoHack", "cache")
+CACHE_MAX_BYTES = 50 * 1024 ** 3          # evict least-recently-used entries above 50 GB
+HASH_BLOCK      = 8 * 1024 ** 2           # bytes read per hashing step
+
+# Preprocessing parameters that change processing() output.
+# FREQUENCY_BACKEND is excluded: both backends are bit-identical.
+KEY_PARAMS = ['TIME_SIZE', 'WINDOW_SIZES', 'SEQUENCE_DEPTH', 'PREPROCESSING_VERSION']
+
+
+# ── Cache Key ─────────────────────────────────────────────────────────────────
+
+def file_digest(path):
+    """
+    SHA-256 of a raw label CSV, read in HASH_BLOCK pieces.
+
+    The digest is memoised in {CACHE_DIR}/digests.json keyed on
+    (path, size, mtime_ns), so unchanged multi-GB files are not re-hashed
+    on every run.
+    """
+    pass
+
+
+def cache_key(raw_path, params):
+    """
+    Content address of one processed file.
+
+      key = sha256(file_digest(raw_path)
+                   + json.dumps({p: params[p] for p in KEY_PARAMS}, sort_keys=True))
+
+    params are read from preprocessing.py (TIME_SIZE, WINDOW_SIZES,
+    SEQUENCE_DEPTH, PREPROCESSING_VERSION), so changing a window or bumping the code
+    version yields a new key and the old entry ages out via LRU.
+    """
+    pass
+
+
+# ── Feature Cache ─────────────────────────────────────────────────────────────
+
+class FeatureCache:
+    """
+    Content-addressed store of processing() output, one entry per raw file.
+
+    Layout:
+      {cache_dir}/{key}.parquet   ← processed features, as processing() returns
+                                    them (float64 intervals / frequencies, no
+                                    PROC_DTYPES downcast — lossless)
+      {cache_dir}/index.json      ← {key: {raw_path, params, bytes, last_access}}
+
+    Shared by the load_data() of all three observations through dataio.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        # Create cache_dir, load index.json (empty if missing)
+        pass
+
+    def get(self, key, columns=None):
+        """
+        Return the cached DataFrame (dataio.load_proc(path, columns), which
+        projects with dataio.project_columns), or None.
+        Updates last_access on a hit.
+        """
+        pass
+
+    def put(self, key, df, meta):
+        """
+        Store df as {key}.parquet: write to a temp file, then os.replace()
+        so a crashed run never leaves a half-written entry. Then evict().
+        """
+        pass
+
+    def get_or_compute(self, raw_path, params, compute, columns=None):
+        """
+        key = cache_key(raw_path, params)
+        Hit  → get(key, columns)
+        Miss → df = compute(raw_path)   (pd.read_csv + processing())
+               put(key, df, meta)
+               return df[dataio.project_columns(df.columns, columns)]
+
+        Both paths project with dataio.project_columns, so the observations'
+        FEATURE_COLS + SEQUENCE_COLS + ['Label', 'Interface'] request works
+        without sequence features, with window-suffixed frequency columns and
+        without Interface. Nothing is cast: Parquet stores the float64 values
+        losslessly, so cold runs, warm runs and {split}_proc.csv runs all
+        train on the same values.
+        """
+        pass
+
+    def evict(self):
+        """
+        While the total bytes in index exceed max_bytes, delete the entry
+        with the oldest last_access. Rewrite index.json atomically.
+        """
+        pass
@@ -0,0 +1,134 @@
+import os
+import json
+import secrets
+import argparse
+import numpy as np
+from multiprocessing import shared_memory
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+BUSES = ['B-CAN', 'C-CAN', 'P-CAN']
+SPLITS = ['train', 'test']
+
+# Descriptor written by `featurestore.py serve`, read by observations via --store
+DESCRIPTOR_PATH = os.path.join("source", "AutoHack", "feature_store.json")
+
+# Arrays held by the store
+#   X         : float32 (n_rows, n_features), C-contiguous
+#   label     : uint8   Label (0–5)
+#   interface : int8    index into BUSES (-1 if Interface was not available)
+#   arb_id    : uint16  Arbitration_ID (for ID-range filters without touching X)
+#   row       : uint32  original row number inside its split
+ARRAYS = ['X', 'label', 'interface', 'arb_id', 'row']
+
+
+# ── Feature Store ─────────────────────────────────────────────────────────────
+
+class FeatureStore:
+    """
+    Both splits loaded once into one contiguous float32 matrix plus index arrays.
+
+    Rows are laid out sorted by (split, interface, original row), and the
+    start / end offset of every (split, bus) block is kept in `blocks`.
+    Per-split and per-bus selections are therefore plain slices of X —
+    zero-copy views, shared by every process attached to the store.
+    """
+
+    def __init__(self, arrays, feature_names, blocks, shms=None):
+        pass
+
+    @classmethod
+    def build(cls, train_path, test_path, feature_cols=None):
+        """
+        Load the proc files once and fill the store.
+
+        feature_cols=None → dataio.resolve_feature_cols() of the train file's
+        schema (window-suffixed frequency columns, present SEQUENCE_COLS).
+
+        1. dataio.load_data(train_path, test_path,
+                            columns=feature_cols + ['Label', 'Interface'])
+        2. order = stable sort of each split by Interface
+        3. Preallocate X = np.empty((n_rows, n_features), np.float32) and
+           copy column by column in `order` — the only full-size copy
+        4. Fill label / interface / arb_id / row; record blocks
+        The DataFrames are released after step 4.
+        """
+        pass
+
+    def view(self, split, bus=None):
+        """
+        Zero-copy (X, label) for a split, or a split × bus block:
+          X[start:end], label[start:end]   (read-only views)
+        """
+        pass
+
+    def select(self, split, predicate, bus=None):
+        """
+        Filtered rows (observation 1/2 train / test filters).
+
+        predicate is a filters.Predicate (TRAIN_FILTER / TEST_FILTER). It is
+        evaluated over the view's index arrays — not X — with
+          predicate.mask_arrays({'Label': label, 'Arbitration_ID': arb_id})
+        (Predicate.mask() expects a DataFrame and is not used here).
+        Returns X_view[mask] (one copy of only the selected rows, which
+        sklearn / xgboost need anyway) and the selected labels.
+        """
+        pass
+
+    def original_order(self, split):
+        """ Index array mapping the store's rows back to file order (for labeled CSVs). """
+        pass
+
+
+# ── Shared Memory ─────────────────────────────────────────────────────────────
+
+def publish(store, name_prefix=None):
+    """
+    Move a built store into POSIX shared memory.
+
+    name_prefix=None → f"ids_store_{os.getpid()}_{secrets.token_hex(4)}", so a
+    second `serve` (another capture, another user) never collides with the
+    segments of a running one. The names are recorded in the descriptor,
+    which is how attaching processes find them.
+
+    For each array in ARRAYS:
+      shm = shared_memory.SharedMemory(create=True, size=arr.nbytes,
+                                       name=f"{name_prefix}_{array}")
+      np.ndarray(arr.shape, arr.dtype, buffer=shm.buf)[:] = arr
+    The local copies are then dropped, so exactly one resident copy exists.
+
+    Returns a JSON-able descriptor: shm names, shapes, dtypes,
+    feature_names, blocks. The publishing process owns the segments and
+    unlinks them at exit (atexit).
+    """
+    pass
+
+
+def attach(descriptor):
+    """
+    Open a published store from its descriptor (dict or DESCRIPTOR_PATH).
+
+    shared_memory.SharedMemory(name=...) per array → np.ndarray views with
+    setflags(write=False). No data is copied.
+    NOTE: attaching processes must not unlink; on Python < 3.13 unregister
+    the segment from multiprocessing.resource_tracker after attaching.
+    """
+    pass
+
+
+def main():
+    """
+    CLI:
+      python featurestore.py serve --train train_proc.parquet --test test_proc.parquet
+        → build + publish, write DESCRIPTOR_PATH, stay alive until Ctrl-C
+          (then unlink the segments)
+
+    Observations started with --store DESCRIPTOR_PATH attach to it instead of
+    loading the proc files themselves.
+    """
+    pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import numpy as np
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+# Arbitration_ID threshold for UDS diagnostic range (0x700 = 1792)
+UDS_ID_THRESHOLD = 1792
+
+
+# ── Expressions ───────────────────────────────────────────────────────────────
+
+class Predicate:
+    """
+    Composable row predicate (expression tree).
+
+    Leaves compare one column with a constant; nodes combine predicates:
+      col('Label') == 4                  → leaf  op '==', args ('Label', 4)
+      p & q,  p | q,  ~p                 → node  op 'and' / 'or' / 'not',
+                                                 args = child predicates
+
+    Only the tree is built here (module-level filters below are built at
+    import); nothing is evaluated until mask() / mask_arrays() / to_arrow().
+    """
+
+    def __init__(self, op, args):
+        self.op = op
+        self.args = args
+
+    def __and__(self, other):
+        return Predicate('and', (self, other))
+
+    def __or__(self, other):
+        return Predicate('or', (self, other))
+
+    def __invert__(self):
+        return Predicate('not', (self,))
+
+    def columns(self):
+        """ Set of column names the predicate reads (for projection / scan). """
+        pass
+
+    def mask(self, df):
+        """
+        Evaluate to one boolean NumPy array of len(df).
+
+        Leaves read a single column as a NumPy view (df[c].to_numpy()) and
+        compare it with the constant. And/Or combine child masks in place
+        (np.logical_and(a, b, out=a)), so evaluation allocates about one
+        boolean array per tree level — never a DataFrame.
+        """
+        pass
+
+    def mask_arrays(self, arrays):
+        """
+        Same as mask(), over a dict of NumPy arrays instead of a DataFrame:
+          {'Label': label, 'Arbitration_ID': arb_id, ...}
+        Leaves read arrays[c] directly. Used by featurestore.select(), whose
+        index arrays live in shared memory and are never wrapped in a frame.
+        KeyError if the predicate reads a column that is not in the dict.
+        """
+        pass
+
+    def to_arrow(self):
+        """ Equivalent pyarrow.compute expression (pc.field(c) == v, &, |, ~) for scan(). """
+        pass
+
+
+class Column:
+    """ col(name): comparison operators (==, !=, <, <=, >, >=) return Predicate leaves. """
+
+    __hash__ = None
+
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, value):
+        return Predicate('==', (self.name, value))
+
+    def __ne__(self, value):
+        return Predicate('!=', (self.name, value))
+
+    def __lt__(self, value):
+        return Predicate('<', (self.name, value))
+
+    def __le__(self, value):
+        return Predicate('<=', (self.name, value))
+
+    def __gt__(self, value):
+        return Predicate('>', (self.name, value))
+
+    def __ge__(self, value):
+        return Predicate('>=', (self.name, value))
+
+
+def col(name):
+    return Column(name)
+
+
+# ── Evaluation ────────────────────────────────────────────────────────────────
+
+def apply(df, predicate, columns=None):
+    """
+    Filter an in-memory DataFrame in a single materialization.
+
+      m = predicate.mask(df)
+      return df.loc[m, columns] if columns else df.loc[m]
+
+    Rows keep their original frame order. Only the selected columns are
+    copied, and only once.
+    """
+    pass
+
+
+def scan(path, predicate, columns=None):
+    """
+    Lazy filter over a proc file without loading it first.
+
+    .parquet : pyarrow.dataset.dataset(path).to_table(
+                   filter=predicate.to_arrow(), columns=columns)
+               → filter pushed down per row group; unselected columns
+                 are never read
+    .csv     : pd.read_csv(path, chunksize=..., usecols=columns ∪ predicate.columns())
+               → apply() per chunk, concatenate the selected rows
+    Row order is preserved in both cases.
+    """
+    pass
+
+
+# ── Observation Filters ───────────────────────────────────────────────────────
+
+# Observation 1 / 2 train filter:
+#   keep  Arbitration_ID < 0x700 (all labels)
+#   keep  Fuzzing (Label 4) with Arbitration_ID >= 0x700
+#   drop  UDS_Spoofing (Label 5)
+TRAIN_FILTER = (
+    ((col('Arbitration_ID') < UDS_ID_THRESHOLD) | (col('Label') == 4))
+    & (col('Label') != 5)
+)
+
+# Observation 1 / 2 test filter: drop UDS_Spoofing only
+TEST_FILTER = col('Label') != 5
@@ -0,0 +1,128 @@
+import numpy as np
+
+
+# ── Flat Forest ───────────────────────────────────────────────────────────────
+
+class FlatForest:
+    """
+    Tree ensemble flattened into contiguous NumPy arrays.
+
+    Node arrays (all trees concatenated, length = total nodes):
+      feature   : int32    split feature index (0 for leaves — export replaces
+                           sklearn's -2 so X[:, feature[node]] never needs a mask)
+      threshold : float64  split threshold (sklearn stores float64 midpoints;
+                           rounding them to float32 could flip a split)
+      left      : int32    left child  (leaves point to themselves)
+      right     : int32    right child (leaves point to themselves)
+      value     : (n_nodes, n_outputs) leaf values
+                  'rf'  float64 — sklearn averages leaf probabilities in float64;
+                        float32 could flip a near-tie argmax (same as threshold)
+                  'xgb' float32 — XGBoost's own leaf precision
+
+    Per-tree / model arrays:
+      roots      : int32    root node index of each tree
+      tree_class : int32    output column each tree adds to (XGBoost multi-class)
+      classes    : original class labels (model.classes_)
+      kind       : 'rf'  → leaf value = class probabilities, averaged over trees,
+                           split rule x <= threshold
+                   'xgb' → leaf value = margin, summed per class + base_score,
+                           split rule x <  threshold
+      base_score : initial margin, already in margin space (see export_xgboost)
+      max_depth  : deepest tree, bounds the traversal loop
+    """
+
+    def __init__(self, feature, threshold, left, right, value,
+                 roots, tree_class, classes, kind, max_depth, base_score=0.0):
+        pass
+
+
+# ── Export ────────────────────────────────────────────────────────────────────
+
+def export_sklearn(model):
+    """
+    Flatten a fitted RandomForestClassifier.
+
+    For each est in model.estimators_:
+      t = est.tree_
+      - offset = nodes exported so far; roots.append(offset)
+      - feature / threshold copied; children shifted by offset
+      - leaves (children_left == -1) → left = right = own index, feature = 0
+      - value = t.value[:, 0, :] normalised per node to probabilities (float64)
+    X is compared as float32 upcast to float64, exactly like sklearn's tree_.apply.
+    """
+    pass
+
+
+def export_xgboost(model):
+    """
+    Flatten a fitted XGBClassifier.
+
+    1. df = model.get_booster().trees_to_dataframe()
+    2. Map node ids ("tree-node") to flat indices; Yes → left, No → right
+       (missing direction is not needed: features are never NaN)
+    3. Leaf 'Gain' column holds the leaf margin → value[:, 0] (float32);
+       leaves get feature = 0, left = right = own index
+    4. tree_class = tree_index % n_classes (1 output for binary)
+    5. base_score from the booster config
+         json.loads(booster.save_config())['learner']['learner_model_param']['base_score']
+       The config stores it in probability space for 'binary:logistic', so it is
+       converted before it can be added to margins:
+         binary:logistic            → base_score = log(p / (1 − p))   (logit)
+         multi:softprob / softmax   → used as is (identity link)
+       Without the logit, flat predictions drift from predict_proba whenever
+       base_score != 0.5 (recent XGBoost versions estimate it from the labels).
+    """
+    pass
+
+
+def export_model(model):
+    """ Dispatch to export_sklearn() / export_xgboost() by model type. """
+    pass
+
+
+# ── Prediction ────────────────────────────────────────────────────────────────
+
+def predict_flat(forest, X):
+    """
+    Vectorized batch prediction over a FlatForest.
+
+    1. X = np.ascontiguousarray(X, dtype=np.float32)   (same cast as sklearn / xgboost)
+    2. node = np.broadcast_to(forest.roots, (n_samples, n_trees)).copy()
+    3. Repeat forest.max_depth times (leaves point to themselves, so no masking):
+         f    = forest.feature[node]          (leaves: f = 0, see FlatForest)
+         x    = X[np.arange(n)[:, None], f]
+         go_l = x <= forest.threshold[node]   ('rf')  /  x < threshold ('xgb')
+         node = np.where(go_l, forest.left[node], forest.right[node])
+    4. Aggregate leaf values:
+         'rf'  : proba = sum of forest.value[node[:, t]] over trees t, in tree
+                 order, then / n_trees — float64, same accumulation as
+                 sklearn's predict_proba
+         'xgb' : margin[:, c] = base_score + sum of trees with tree_class == c
+                 (np.add.at over tree_class)
+    5. Class index = argmax (binary xgb: margin > 0)
+    Returns forest.classes[index] — same labels as model.predict(X).
+    """
+    pass
+
+
+def predict_proba_flat(forest, X):
+    """
+    Class probabilities, same layout as model.predict_proba(X).
+
+      'rf'  : mean leaf probabilities (step 4 of predict_flat)
+      'xgb' : binary → p = sigmoid(margin), returns [1 − p, p]
+              multi  → softmax(margin, axis=1)
+    """
+    pass
+
+
+def verify_flat(model, forest, X):
+    """
+    Equivalence check:
+      np.array_equal(model.predict(X), predict_flat(forest, X))
+      np.allclose(model.predict_proba(X), predict_proba_flat(forest, X),
+                  rtol=1e-5, atol=1e-6)
+    The probability check catches a base_score left in probability space,
+    which may not flip any argmax on X but shifts every score.
+    """
+    pass
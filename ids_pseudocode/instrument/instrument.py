@@ -0,0 +1,133 @@
+import os
+import sys
+import json
+import time
+import resource
+import cProfile
+from contextlib import contextmanager
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+REPORT_DIR = os.path.join("report", "timing")
+
+# Linux per-stage peak RSS: writing "5" resets the VmHWM high-water mark
+CLEAR_REFS = "/proc/self/clear_refs"
+PROC_STATUS = "/proc/self/status"
+
+
+# ── Stage Timing ──────────────────────────────────────────────────────────────
+
+class StageRecorder:
+    """
+    Collects one record per timed stage of a run.
+
+    Record fields:
+      name      : dotted stage path, nested stages joined with '.'
+                  e.g. 'processing.4_intervals', 'obs2.train_model_c'
+      wall_sec  : time.perf_counter() delta
+      cpu_sec   : time.process_time() delta (this process)
+      child_cpu_sec : RUSAGE_CHILDREN delta (process-pool workers)
+      peak_rss_mb   : peak RSS reached during this stage (reset_peak_rss()
+                      at entry, read_peak_rss_mb() at exit)
+      pid       : process that ran the stage (pool workers differ)
+      rows      : optional row count, for rows/s in the report
+    """
+
+    def __init__(self):
+        pass
+
+    def add(self, record):
+        pass
+
+    def drain(self):
+        """
+        Return the records and clear them. Pool workers return this from
+        their entry point (e.g. preprocessing.process_shard) so the parent
+        can merge them.
+        """
+        pass
+
+    def extend(self, records, prefix=None):
+        """
+        Append records drained in another process, names prefixed with
+        f"{prefix}." (e.g. 'shard.0.B-CAN'), keeping their pid.
+        """
+        pass
+
+
+# One recorder per process; workers hand their records back with drain()
+RECORDER = StageRecorder()
+
+
+def reset_peak_rss():
+    """
+    Reset the kernel's VmHWM to the current RSS: write "5" to CLEAR_REFS.
+    Returns False if unavailable (non-Linux, or /proc not writable); the
+    stage then falls back to ru_maxrss, the lifetime high-water mark.
+    """
+    pass
+
+
+def read_peak_rss_mb():
+    """
+    VmHWM from PROC_STATUS (kB → MB): the peak RSS since the last
+    reset_peak_rss(). Fallback: getrusage(RUSAGE_SELF).ru_maxrss.
+    """
+    pass
+
+
+@contextmanager
+def stage(name, rows=None):
+    """
+    Time a block:
+
+      with stage('processing.5_frequency', rows=len(df)):
+          ...
+
+    Nested stage() calls extend the parent's name. Overhead is two clock
+    reads, one getrusage() and two small /proc accesses per call, so it is
+    safe around each numbered step of processing() but not per frame.
+
+    Peak RSS per stage:
+      entry : fold read_peak_rss_mb() into the enclosing stage's running
+              peak (a nested reset would otherwise erase it), then
+              reset_peak_rss()
+      exit  : peak_rss_mb = max(read_peak_rss_mb(), peak of nested stages);
+              the enclosing stage's running peak is raised to it
+    """
+    pass
+
+
+# ── Report ────────────────────────────────────────────────────────────────────
+
+def write_report(script, report_dir=REPORT_DIR):
+    """
+    Write the run's timing report as JSON:
+      {report_dir}/{script}_{YYYYmmdd-HHMMSS}.json
+
+    Contents:
+      run    : script, argv, start time, hostname, python version,
+               git commit (git rev-parse HEAD, if available), cpu count
+      stages : RECORDER records in execution order
+      total  : wall_sec, cpu_sec, max_rss_mb (lifetime high-water mark)
+    One file per run so nightly results can be diffed across commits.
+    """
+    pass
+
+
+# ── Profiling ─────────────────────────────────────────────────────────────────
+
+@contextmanager
+def profiled(enabled, script, report_dir=REPORT_DIR):
+    """
+    Optional whole-run profile (--profile flag).
+
+    enabled=True wraps the block in cProfile.Profile and dumps
+    {report_dir}/{script}_{timestamp}.prof — readable with pstats,
+    snakeviz or flameprof.
+    For sampling without in-process overhead, run the same command
+    under py-spy instead:
+      py-spy record --format speedscope -o {script}.json -- python {script}.py
+    """
+    pass
@@ -0,0 +1,109 @@
+import os
+import json
+import time
+import hashlib
+import secrets
+import numpy as np
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+STORE_FORMAT_VERSION = 1
+STORE_SUFFIX         = '.store'       # {name}_C.store/ directory per model
+
+# FlatForest arrays written as one .npy file each
+ARRAY_FIELDS = ['feature', 'threshold', 'left', 'right', 'value', 'roots', 'tree_class']
+
+
+# ── Save ──────────────────────────────────────────────────────────────────────
+
+def data_digest(X, y):
+    """
+    SHA-256 over the training matrix and labels (contiguous bytes of
+    X as float32 and y), used to tie a stored model to its training data.
+    """
+    pass
+
+
+def save_store(model, path, feature_cols, label_map, train_digest):
+    """
+    Write a model as a memory-mappable store directory.
+
+    1. forest = flattree.export_model(model)
+    2. For each field in ARRAY_FIELDS:
+         np.save(f"{path}/{field}.npy", np.ascontiguousarray(array))
+       (.npy is a fixed header + raw buffer → np.load(mmap_mode='r') maps it)
+    3. meta.json:
+         format_version : STORE_FORMAT_VERSION
+         kind           : 'rf' / 'xgb', classes, base_score, max_depth
+         feature_cols   : ordered feature list the model was trained on
+         label_map      : {code: class name}
+         train_digest   : data_digest() of the training set
+         checksums      : {field: SHA-256 of the .npy file}
+         created        : ISO timestamp
+    4. Publish atomically, also over an existing store (save_models rewrites
+       {name}_C.store on every save / update):
+         version = f"{path}.{time.strftime('%Y%m%dT%H%M%S')}-{secrets.token_hex(4)}"
+         write steps 2–3 into the version directory
+         os.symlink(os.path.basename(version), f"{path}.lnk.tmp")
+         os.replace(f"{path}.lnk.tmp", path)      → path now points at version
+       os.replace() swaps a symlink in one rename; it cannot replace a
+       non-empty directory, so a plain directory left at path (older layout)
+       is first renamed aside with os.replace(path, f"{path}.old-{token}").
+    5. Remove the previous version directory (and any .old-* aside).
+       Readers that already mapped its arrays keep their pages until they
+       close them (POSIX unlink semantics).
+    """
+    pass
+
+
+# ── Load ──────────────────────────────────────────────────────────────────────
+
+def load_store(path, feature_cols=None, verify=False):
+    """
+    Open a store directory as a flattree.FlatForest.
+
+    0. path = os.path.realpath(path) — resolved once, so meta and every
+       array come from the same version even if save_store() swaps the
+       link meanwhile
+    1. meta = json.load(meta.json); check format_version
+    2. If feature_cols is given, it must equal meta['feature_cols']
+       (same names, same order) — raise ValueError otherwise
+    3. Arrays: np.load(f"{path}/{field}.npy", mmap_mode='r')
+         → read-only views over the OS page cache; every worker process
+           that opens the store shares the same physical pages
+    4. verify=True recomputes the SHA-256 checksums (reads every page;
+       off by default so loading stays O(1))
+    Returns FlatForest, meta.
+    """
+    pass
+
+
+# ── Estimator Adapter ─────────────────────────────────────────────────────────
+
+class StoreModel:
+    """
+    Estimator-like wrapper around a loaded store, so code written for the
+    pickled sklearn / xgboost model works unchanged (cascade_predict,
+    cache_scores, evaluate, OnlineIDS).
+
+      classes_           : meta['classes']
+      feature_names_in_  : meta['feature_cols']
+      predict(X)         → flattree.predict_flat(forest, X)
+      predict_proba(X)   → flattree.predict_proba_flat(forest, X)
+    X may be a DataFrame (columns reordered to feature_names_in_) or an array.
+    """
+
+    def __init__(self, forest, meta):
+        pass
+
+    def predict(self, X):
+        pass
+
+    def predict_proba(self, X):
+        pass
+
+
+def load_estimator(path, feature_cols=None, verify=False):
+    """ load_store() wrapped in a StoreModel. """
+    pass
@@ -1,5 +1,11 @@
 import os
+import sys
 import pickle
+import argparse
+
+# Feature columns (FEATURE_COLS, SEQUENCE_COLS) are defined once, in dataio
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from dataio.dataio import FEATURE_COLS, SEQUENCE_COLS, resolve_feature_cols
 
 
 # ── Constants ─────────────────────────────────────────────────────────────────
@@ -12,12 +18,27 @@ LABEL_MAP = {
     3: 'Replay',  4: 'Fuzzing',  5: 'UDS_Spoofing'
 }
 
+# Stage-1 attack probability above which a row is sent to Stage 2 (cascade mode)
+CASCADE_THRESHOLD = 0.5
+
+# Test rows per evaluation batch (evaluation.evaluate_stream); None = whole test set in memory
+EVAL_BATCH_SIZE = None
+
+# Training-set sampling (sampler.sample_train); None = use every row
+# e.g. {'strategy': 'class_cap', 'caps': {0: 500_000}, 'seed': 0}
+SAMPLE_CONFIG = None
+
+
 
 # ── Helper Functions ───────────────────────────────────────────────────────────
 
 def load_data(train_path, test_path):
     """
-    Load preprocessed train/test CSV files.
+    Load preprocessed train/test files (.csv or .parquet).
+    Paths may also be raw split directories: features are then served by
+    the shared feature cache, running processing() only on a miss.
+    Delegates to dataio.load_data() with
+    columns = FEATURE_COLS + SEQUENCE_COLS + ['Label'].
     Returns train_df, test_df.
     """
     pass
@@ -34,6 +55,11 @@ def filter_train(df):
 
     This ensures the model is trained on periodic CAN traffic only,
     deliberately excluding aperiodic UDS normal traffic.
+
+    Implementation:
+      feature_cols = resolve_feature_cols(df)   (window-suffixed + present SEQUENCE_COLS)
+      filters.apply(df, filters.TRAIN_FILTER, columns=feature_cols + ['Label'])
+        → one boolean mask, one copy, original row order
     """
     pass
 
@@ -44,6 +70,10 @@ def filter_test(df):
     Remove UDS_Spoofing (Label == 5) from test set.
     UDS normal traffic (Label == 0, ID >= 0x700) is kept to evaluate
     how well the model handles unseen aperiodic traffic.
+
+    Implementation:
+      feature_cols = resolve_feature_cols(df)   (window-suffixed + present SEQUENCE_COLS)
+      filters.apply(df, filters.TEST_FILTER, columns=feature_cols + ['Label'])
     """
     pass
 
@@ -51,19 +81,35 @@ def filter_test(df):
 def extract_features(df):
     """
     Separate feature matrix and target labels from dataframe.
-    Drop non-feature columns: Class, Label, Timestamp, Interface, Data.
+    X = df[resolve_feature_cols(df)] — the loader
+    already projected away Class, Timestamp, Interface and Data.
     Returns X (features), y_class (binary), y_subclass (multi-class).
     """
     pass
 
 
-def save_model(model, filepath):
-    """ Serialize model to pickle file. """
+def save_model(model, filepath, model_format='pickle',
+               feature_cols=None, label_map=LABEL_MAP, train_digest=None):
+    """
+    Serialize model to pickle file.
+    model_format='store' writes modelstore.save_store(model, filepath,
+    feature_cols, label_map, train_digest) instead ({name}.store/ directory,
+    memory-mappable, with integrity metadata). feature_cols is the
+    resolve_feature_cols() list the model was trained on and train_digest
+    is modelstore.data_digest(X_train, y_train); both are required for
+    the store (ValueError if missing).
+    """
     pass
 
 
-def load_model(filepath):
-    """ Load model from pickle file. """
+def load_model(filepath, feature_cols=None):
+    """
+    Load model from pickle file.
+    A *.store directory is opened with modelstore.load_estimator(filepath,
+    feature_cols) — a StoreModel with predict() / predict_proba(), so
+    cascade_predict() and evaluate() use it like the pickled model.
+    feature_cols, if given, must match the store's metadata.
+    """
     pass
 
 
@@ -87,7 +133,26 @@ def train_multiclass(X_train, y_subclass):
 
 # ── Evaluation ────────────────────────────────────────────────────────────────
 
-def evaluate(clf_binary, clf_multi, X_test, y_class_true, y_subclass_true):
+def cascade_predict(clf_binary, clf_multi, X_test, threshold=CASCADE_THRESHOLD):
+    """
+    Cascade variant of evaluate(): clf_multi only scores rows clf_binary flags.
+
+      p_attack      = clf_binary.predict_proba(X_test)[:, 1]
+      attack        = p_attack > threshold        ('>' : a 0.5 tie stays Normal,
+                                                   as in clf_binary.predict)
+      pred_subclass = zeros (Normal) for every row
+      pred_subclass[attack] = clf_multi.predict(X_test[attack])
+      pred_class    = (pred_subclass != 0).astype(int)
+                      (a row Stage 2 labels Normal is reported as class 0)
+
+    Returns pred_class, pred_subclass, stats
+      stats: stage2_rows, stage2_rows_saved, seconds
+    """
+    pass
+
+
+def evaluate(clf_binary, clf_multi, X_test, y_class_true, y_subclass_true,
+             cascade=False, threshold=CASCADE_THRESHOLD, batch_size=EVAL_BATCH_SIZE):
     """
     Generate classification reports for both stages.
 
@@ -95,7 +160,22 @@ def evaluate(clf_binary, clf_multi, X_test, y_class_true, y_subclass_true):
     Multi report    : precision / recall / F1 per attack type
     Confusion matrix: plotted for both stages
 
+    cascade=False : both classifiers predict every test row (original behavior)
+    cascade=True  : predictions come from cascade_predict(); the report also
+                    lists Stage-2 rows saved and wall-clock time against the
+                    full two-model run on the same X_test
+
+    batch_size    : test rows come from evaluation.iter_batches(...,
+                    predicate=filters.TEST_FILTER) instead of X_test;
+                    evaluation.evaluate_stream(..., n_classes=2,
+                    n_subclasses=5, label_map=LABEL_MAP) accumulates both
+                    confusion matrices (also per bus / ID range) and writes
+                    the labeled CSV per batch. Reports are built from the
+                    matrices with evaluation.classification_report() — same
+                    values as sklearn. Nothing is returned in this mode.
+
     Saves reports as .txt and confusion matrix as .jpg.
+    Returns pred_class, pred_subclass for save_labeled_csv().
     """
     pass
 
@@ -111,22 +191,40 @@ def save_labeled_csv(test_df, pred_class, pred_subclass, output_path):
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 
-def main():
+def main(profile=False, store=None):
     """
     Execution flow:
 
     1. Load preprocessed train/test data
     2. Apply train filter  (remove non-periodic UDS normal + UDS_Spoofing)
+         then sampler.sample_train(train_df, SAMPLE_CONFIG) if set
     3. Apply test filter   (remove UDS_Spoofing only)
     4. Extract features
     5. Choose action:
          (a) Train new models → save as .pkl
          (b) Load existing .pkl models
     6. Evaluate → save reports + confusion matrix
+         (cascade=True: Stage 2 only on rows flagged as Attack)
     7. (Optional) Save labeled CSV for downstream analysis
+         (written during step 6 when EVAL_BATCH_SIZE is set)
+
+    store: feature store descriptor (featurestore.attach). Steps 1–4 then
+    become store.select('train', TRAIN_FILTER) / store.select('test',
+    TEST_FILTER) on the shared matrix — no proc files are read.
+
+    Steps 1–6 each run inside instrument.stage(); the timing report is
+    written to report/timing/observation1_{timestamp}.json.
+    profile=True also dumps a cProfile .prof.
     """
     pass
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Observation 1 — attack classification difficulty")
+    parser.add_argument("--profile", action="store_true",
+                        help="dump a cProfile .prof next to the timing report")
+    parser.add_argument("--store", default=None,
+                        help="feature store descriptor (featurestore.py serve)")
+    args = parser.parse_args()
+
+    main(profile=args.profile, store=args.store)
@@ -1,5 +1,12 @@
 import os
+import sys
 import pickle
+import argparse
+
+# Feature columns (FEATURE_COLS, SEQUENCE_COLS) are defined once, in dataio
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from dataio.dataio import FEATURE_COLS, SEQUENCE_COLS, resolve_feature_cols
+from instrument import instrument
 
 
 # ── Constants ─────────────────────────────────────────────────────────────────
@@ -15,12 +22,39 @@ LABEL_MAP = {
 # Arbitration_ID threshold for UDS diagnostic range (0x700 = 1792)
 UDS_ID_THRESHOLD = 1792
 
+# Stage-1 attack probability above which a row is sent to Stage 2 (cascade mode)
+CASCADE_THRESHOLD = 0.5
+
+# Test rows per evaluation batch (evaluation.evaluate_stream); None = whole test set in memory
+EVAL_BATCH_SIZE = None
+
+# Search results from tuning.py; when present, best_C / best_S are taken from it
+TUNED_PARAMS = os.path.join("source", "AutoHack", "tuning", "best_params.json")
+
+# Incremental update: capacity added per new capture
+ADD_TREES  = 20     # RF   : extra trees (warm_start)
+ADD_ROUNDS = 50     # XGB  : extra boosting rounds (xgb_model=...)
+
+# Threshold sweep: recall levels at which FPR is reported
+TARGET_RECALLS = [0.90, 0.95, 0.99, 0.999]
+
+# Training-set sampling (sampler.sample_train); None = use every row
+# e.g. {'strategy': 'class_cap', 'caps': {0: 500_000}, 'seed': 0}
+SAMPLE_CONFIG = None
+
+
 
 # ── Helper Functions ───────────────────────────────────────────────────────────
 
 def load_data(train_path, test_path):
     """
-    Load preprocessed train/test CSV files (train_proc.csv, test_proc.csv).
+    Load preprocessed train/test files (train_proc.csv / .parquet, test_proc.csv / .parquet).
+    Paths may also be raw split directories: features are then served by
+    the shared feature cache, running processing() only on a miss.
+    Delegates to dataio.load_data() with
+    columns = FEATURE_COLS + SEQUENCE_COLS + ['Label', 'Interface'].
+    Interface (kept when the file has it) is not a feature: it is carried
+    for the per-bus threshold breakdown and dropped in extract_features().
     Returns train_df, test_df.
     """
     pass
@@ -49,6 +83,14 @@ def filter_train(df):
       df_low_id          = df[df["Arbitration_ID"] < 1792]               # all non-UDS frames
       train = concat([df_label4_high_id, df_low_id])                     # merge
       train = train[train["Label"] != 5]                                  # remove UDS_Spoofing
+
+    Current implementation (single mask, no intermediate frames):
+      TRAIN_FILTER = ((col('Arbitration_ID') < 1792) | (col('Label') == 4)) & (col('Label') != 5)
+      feature_cols = resolve_feature_cols(df)   (window-suffixed + present SEQUENCE_COLS)
+      keep  = ['Label'] + (['Interface'] if 'Interface' in df else [])
+      train = filters.apply(df, TRAIN_FILTER, columns=feature_cols + keep)
+    Selects the same rows as ids.py, but keeps the original frame order
+    (ids.py put UDS-range Fuzzing rows first).
     """
     pass
 
@@ -70,6 +112,12 @@ def filter_test(df):
     Implementation (from ids.py):
       test = df[df['Label'] != 5]
 
+    Current implementation:
+      feature_cols = resolve_feature_cols(df)   (window-suffixed + present SEQUENCE_COLS)
+      keep = ['Label'] + (['Interface'] if 'Interface' in df else [])
+      test = filters.apply(df, TEST_FILTER, columns=feature_cols + keep)
+    SEQUENCE_COLS are kept in both filters so extract_features() can use them.
+
     NOTE: Unlike train filter, test does NOT remove UDS normal traffic.
     This asymmetry is the core of Observation 2 — the model encounters
     aperiodic UDS normal traffic only at test time.
@@ -80,21 +128,35 @@ def filter_test(df):
 def extract_features(df):
     """
     Separate feature matrix and labels.
-    Drop non-feature columns: Class, Label, Timestamp.
-
-    Feature columns are defined as all remaining columns after exclusion.
+    X = df[resolve_feature_cols(df)] — only the feature columns the
+    loader projected; Label and Interface never reach the model.
     Returns X (features), y_class (binary 0/1), y_subclass (0–4).
     """
     pass
 
 
-def save_model(model, filepath):
-    """ Serialize trained model to pickle file. """
+def save_model(model, filepath, model_format='pickle',
+               feature_cols=None, label_map=LABEL_MAP, train_digest=None):
+    """
+    Serialize trained model to pickle file.
+    model_format='store' writes modelstore.save_store(model, filepath,
+    feature_cols, label_map, train_digest) instead ({name}.store/ directory,
+    memory-mappable, with integrity metadata). feature_cols is the
+    resolve_feature_cols() list the model was trained on and train_digest
+    is modelstore.data_digest(X_train, y_train); both are required for
+    the store (ValueError if missing).
+    """
     pass
 
 
-def load_model(filepath):
-    """ Load previously trained model from pickle file. """
+def load_model(filepath, feature_cols=None):
+    """
+    Load previously trained model from pickle file.
+    A *.store directory is opened with modelstore.load_estimator(filepath,
+    feature_cols) — a StoreModel with predict() / predict_proba(), so
+    cascade_predict() and evaluate() use it like the pickled model.
+    feature_cols, if given, must match the store's metadata.
+    """
     pass
 
 
@@ -125,6 +187,7 @@ def evaluate_binary(clf_C, X_test, y_class_true):
     Evaluate Stage-1 binary classifier.
     Prints and saves classification report.
     Plots confusion matrix for Normal vs Attack.
+    (Batched equivalent: evaluation.evaluate_stream() → class accumulator.)
     """
     pass
 
@@ -134,6 +197,7 @@ def evaluate_multiclass(clf_S, X_test, y_subclass_true):
     Evaluate Stage-2 multi-class classifier.
     Prints and saves classification report.
     Plots confusion matrix for all 5 attack classes.
+    (Batched equivalent: evaluation.evaluate_stream() → subclass accumulator.)
 
     NOTE: UDS_Spoofing row will appear in confusion matrix as all-zero
     because it was excluded from the test set — this is expected behavior.
@@ -141,6 +205,20 @@ def evaluate_multiclass(clf_S, X_test, y_subclass_true):
     pass
 
 
+def cascade_predict(clf_C, clf_S, X_test, threshold=CASCADE_THRESHOLD):
+    """
+    Used by IDSModel.save_report() when self.cascade is set.
+
+      attack        = clf_C.predict_proba(X_test)[:, 1] > threshold
+      pred_subclass = 0 everywhere; clf_S.predict(X_test[attack]) on flagged rows
+      pred_class    = (pred_subclass != 0) — clf_S is trained with Normal
+                      rows too, so it can overrule a Stage-1 alarm
+
+    Returns pred_class, pred_subclass, stats (stage2_rows, stage2_rows_saved, seconds).
+    """
+    pass
+
+
 def save_labeled_csv(test_df, pred_class, pred_subclass, output_path):
     """
     Append prediction results to test dataframe and save as CSV.
@@ -150,6 +228,71 @@ def save_labeled_csv(test_df, pred_class, pred_subclass, output_path):
     pass
 
 
+# ── Threshold Sweep ───────────────────────────────────────────────────────────
+
+def model_digest(model):
+    """ SHA-256 of pickle.dumps(model) — identifies the exact fitted clf_C. """
+    pass
+
+
+def cache_scores(clf_C, X_test, test_df, scores_path):
+    """
+    Compute Stage-1 scores once and cache them next to the labeled CSV.
+
+      score = clf_C.predict_proba(X_test)[:, 1]     (only model call)
+      np.savez(scores_path,                         → {name}_scores.npz
+               score=float32, y_class=uint8, label=uint8,
+               arbitration_id=uint16,
+               interface=bus index from test_df['Interface'] (-1 only if the
+                         proc file has no Interface column),
+               model_digest=model_digest(clf_C),
+               data_digest=modelstore.data_digest(X_test, y_class))
+    """
+    pass
+
+
+def curves(y_true, score):
+    """
+    Full ROC and PR curves in one vectorized pass (no re-prediction).
+
+      order = np.argsort(-score, kind='stable')
+      tp    = np.cumsum(y_true[order]);  fp = np.cumsum(1 - y_true[order])
+      keep  = last index of each distinct score (np.diff(score[order]) != 0)
+      tpr   = tp / P;  fpr = fp / N;  precision = tp / (tp + fp)
+      roc_auc = np.trapz(tpr, fpr);  pr_auc = average precision
+    Returns dict of arrays (threshold, tpr, fpr, precision) + roc_auc, pr_auc.
+    """
+    pass
+
+
+def fpr_at_recall(c, recalls=TARGET_RECALLS):
+    """
+    For each target recall, the highest threshold reaching it
+    (np.searchsorted on the non-decreasing tpr) and the FPR there.
+    Returns rows: recall, threshold, fpr, precision.
+    """
+    pass
+
+
+def threshold_sweep(scores_path, recalls=TARGET_RECALLS):
+    """
+    ROC / PR and FPR-at-recall from cached scores, broken down by group.
+
+    Groups (masks over the cached arrays):
+      all        : every test row
+      id < 0x700 : arbitration_id <  UDS_ID_THRESHOLD (periodic range)
+      id >= 0x700: arbitration_id >= UDS_ID_THRESHOLD (UDS range — the
+                   unseen Normal traffic of Observation 2)
+      per bus    : interface == each bus (skipped if interface is -1)
+
+    Each group: curves() + fpr_at_recall(). Also reports, per group, the
+    FPR at the default 0.5 threshold for comparison with evaluate_binary().
+    A threshold chosen on 'all' is applied to every group, so the report
+    shows what the operating point costs on UDS traffic.
+    """
+    pass
+
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 
 class IDSModel:
@@ -164,40 +307,142 @@ class IDSModel:
          train_model_s()   → train multi-class classifier (if Train selected)
          save_models()     → save both models as .pkl     (if Train selected)
       4. use_model()       → load clf_C and clf_S from .pkl (if Load selected)
+      4. update_model_c()  → add trees / rounds to clf_C from new data (if Update selected)
+         update_model_s()  → same for clf_S, then save_models() as the next version
       5. save_report()     → predict + save classification reports as .txt
       6. save_label()      → save test data + predictions as labeled .csv (optional)
       7. show_confusion_matrix() → plot and save confusion matrices as .jpg
+      8. save_threshold_report() → ROC / PR / FPR-at-recall from cached scores (optional)
+
+    Each step runs inside instrument.stage(); the timing report is written
+    to report/timing/observation2_{timestamp}.json at the end of the run.
     """
 
     def __init__(self):
         # RF hyperparameters (used when switching from XGBoost to RF)
         self.best_C = {'rf_n_estimators': 170, 'rf_max_depth': 15}
         self.best_S = {'rf_n_estimators': 130, 'rf_max_depth': 30}
+        # Overridden by tuning.load_best(TUNED_PARAMS)['best_C' / 'best_S'] when the file exists
 
         self.clf_C = None   # Stage-1 binary classifier
         self.clf_S = None   # Stage-2 multi-class classifier
 
+        self.version = 0    # model artifact version ({name}_C_v{version}.pkl)
+
+        self.feature_cols = None   # resolve_feature_cols() of the training set, set by define_file()
+
+        self.sample_config = SAMPLE_CONFIG   # training-set sampling (None = all rows)
+
+        self.store = None   # feature store descriptor (featurestore.attach); None = load files
+
+        self.eval_batch_size = EVAL_BATCH_SIZE   # batched evaluation (evaluation.py); None = in memory
+
+        # Cascade inference: run clf_S only on rows clf_C flags as Attack
+        self.cascade           = False
+        self.cascade_threshold = CASCADE_THRESHOLD
+
     def define_file(self):
         """
         Load data, apply filters, extract features.
         See filter_train() and filter_test() for inclusion/exclusion details.
+        After filter_train(), sampler.sample_train(train_df, self.sample_config)
+        is applied when a config is set; the test set is never sampled.
+        Sets self.feature_cols = resolve_feature_cols(train_df).
+
+        With self.store set, the data comes from the shared feature store:
+          store = featurestore.attach(self.store)
+          X_train, y_train = store.select('train', TRAIN_FILTER)
+          X_test,  y_test  = store.select('test',  TEST_FILTER)
         """
         pass
 
     def train_model_c(self):
-        """ Train Stage-1 binary classifier. XGBoost by default. """
+        """
+        Train Stage-1 binary classifier. XGBoost by default.
+        RF uses self.best_C (rf_n_estimators, rf_max_depth, and any other
+        rf_* keys written by tuning.py, e.g. rf_min_samples_leaf).
+        """
         pass
 
     def train_model_s(self):
-        """ Train Stage-2 multi-class classifier. XGBoost by default. """
+        """
+        Train Stage-2 multi-class classifier. XGBoost by default.
+        RF uses self.best_S, same keys as train_model_c().
+        """
+        pass
+
+    def define_update_file(self, new_path):
+        """
+        Load a new capture (proc file) for incremental training.
+        Apply filter_train() + extract_features() → X_new, y_class_new, y_subclass_new.
+        """
+        pass
+
+    def update_model_c(self, add_trees=ADD_TREES, add_rounds=ADD_ROUNDS):
+        """
+        Extend clf_C with capacity trained only on the new capture.
+
+        RF  : clf_C.set_params(warm_start=True,
+                               n_estimators=clf_C.n_estimators + add_trees)
+              clf_C.fit(X_new, y_class_new)   → only the new trees are fitted
+        XGB : old_booster = clf_C.get_booster()
+              clf_C = XGBClassifier(**{**clf_C.get_params(), 'n_estimators': add_rounds})
+              clf_C.fit(X_new, y_class_new, xgb_model=old_booster)
+                                               → boosting continues from old trees
+              (get_params() already holds n_estimators, so it is overridden in
+               the dict — passing it as a second keyword raises TypeError)
+
+        NOTE: RF warm start needs every class of the old model in the new
+        data (classes_ must not change); otherwise fall back to train_model_c().
+        Records training seconds for the incremental report.
+        """
+        pass
+
+    def update_model_s(self, add_trees=ADD_TREES, add_rounds=ADD_ROUNDS):
+        """ Same as update_model_c() for clf_S on y_subclass_new. """
+        pass
+
+    def compare_update(self):
+        """
+        Incremental vs full retrain report.
+
+        1. Evaluate the updated clf_C / clf_S on the test set
+        2. (Optional) full retrain: train_model_c() / train_model_s() on
+           old + new data combined
+        3. Save {name} Update report.txt:
+             version, data files, accuracy / macro-F1 per stage,
+             training seconds — incremental vs full retrain
+        """
         pass
 
     def use_model(self):
-        """ Load existing clf_C (*_C.pkl) and clf_S (*_S.pkl) from disk. """
+        """
+        Load existing clf_C (*_C.pkl) and clf_S (*_S.pkl) from disk.
+        With versioned artifacts the latest version in {name}_manifest.json
+        is loaded unless a version is requested.
+        If only inference is needed, the *.store directories are preferred:
+        load_model() memory-maps them instead of unpickling.
+        """
         pass
 
     def save_models(self):
-        """ Save clf_C and clf_S as pickle files. """
+        """
+        Save clf_C and clf_S as pickle files.
+
+        Versioned artifacts:
+          IDS_Model/IDS/{name}_C_v{version}.pkl
+          IDS_Model/IDS/{name}_S_v{version}.pkl
+          IDS_Model/IDS/{name}_manifest.json
+            → per version: parent version, training data files + SHA-256,
+              n_estimators per stage, training seconds, mode (full / update)
+        Previous versions are kept so an update can be rolled back.
+
+        Alongside the pickles, {name}_C.store / {name}_S.store are written
+        with save_model(..., model_format='store',
+                        feature_cols=self.feature_cols,
+                        train_digest=modelstore.data_digest(X_train, y))
+        for fast, shared loading (y = y_class for C, y_subclass for S).
+        """
         pass
 
     def save_report(self):
@@ -205,6 +450,19 @@ class IDSModel:
         Run predictions and save classification reports.
         Binary report  → {name} Binary report.txt
         Multi report   → {name} Multi report.txt
+
+        self.eval_batch_size set: define_file() keeps only the test path and
+        the test set is streamed with evaluation.evaluate_stream(...,
+        n_classes=2, n_subclasses=5, label_map=LABEL_MAP) over
+        evaluation.iter_batches(..., predicate=filters.TEST_FILTER), so the
+        batched _labeled.csv names class 1 'Flooding' like save_labeled_csv(). Both
+        reports come from the accumulated confusion matrices, plus
+        {name} grouped report.txt (per bus / ID range) and
+        {name}_labeled.csv written per batch — save_label() is then a no-op.
+
+        self.cascade=True predicts with cascade_predict() and appends
+        Stage-2 rows saved and wall-clock time vs the full run to the
+        Multi report. Predictions are kept for save_label().
         """
         pass
 
@@ -219,35 +477,73 @@ class IDSModel:
         """
         Plot confusion matrices for both stages side by side.
         Save as {name}.jpg.
+        In batched mode the plotted matrices are acc.matrix() from save_report().
+        """
+        pass
+
+    def save_threshold_report(self):
+        """
+        Operating-point analysis without touching the model again.
+
+        1. cache_scores(clf_C, ...) if {name}_scores.npz is missing, or if its
+           model_digest / data_digest differ from the current clf_C and test
+           set (after update_model_c() or a retrain under the same name)
+        2. threshold_sweep({name}_scores.npz)
+        3. Save {name} Threshold report.txt (FPR-at-recall per group)
+           and {name}_curves.csv (threshold, tpr, fpr, precision per group)
         """
         pass
 
 
 if __name__ == "__main__":
-    ids = IDSModel()
-    ids.define_file()
+    parser = argparse.ArgumentParser(description="Observation 2 — UDS traffic filter")
+    parser.add_argument("--profile", action="store_true",
+                        help="dump a cProfile .prof next to the timing report")
+    parser.add_argument("--store", default=None,
+                        help="feature store descriptor (featurestore.py serve)")
+    args = parser.parse_args()
+
+    with instrument.profiled(args.profile, "observation2"):
+        ids = IDSModel()
+        ids.store = args.store
+        ids.define_file()
+
+        # Step 1: Choose action — train new model, load existing, or update existing
+        # Options: "Train XGBoost" / "Use Model" / "Update Model"
+        model_choice = None  # get_user_choice(["Train XGBoost", "Use Model", "Update Model"])
+
+        ids.get_name()
+
+        if model_choice == "Train XGBoost":
+            ids.train_model_c()
+            ids.train_model_s()
+            ids.save_models()
 
-    # Step 1: Choose action — train new model or load existing
-    # Options: "Train XGBoost" / "Use Model"
-    model_choice = None  # get_user_choice(["Train XGBoost", "Use Model"])
+        if model_choice == "Use Model":
+            ids.use_model()
 
-    ids.get_name()
+        if model_choice == "Update Model":
+            ids.use_model()
+            ids.define_update_file(new_path=None)   # new day of capture
+            ids.update_model_c()
+            ids.update_model_s()
+            ids.save_models()                       # next version
+            ids.compare_update()
 
-    if model_choice == "Train XGBoost":
-        ids.train_model_c()
-        ids.train_model_s()
-        ids.save_models()
+        # Optional: cascade inference (clf_S only on rows clf_C flags as Attack)
+        # ids.cascade = True
+        ids.save_report()
 
-    if model_choice == "Use Model":
-        ids.use_model()
+        # Step 2: Choose whether to save labeled CSV
+        # Options: "Save Label" / "Only Report"
+        save_choice = None   # get_user_choice(["Save Label", "Only Report"])
 
-    ids.save_report()
+        if save_choice == "Save Label":
+            ids.save_label()
 
-    # Step 2: Choose whether to save labeled CSV
-    # Options: "Save Label" / "Only Report"
-    save_choice = None   # get_user_choice(["Save Label", "Only Report"])
+        ids.show_confusion_matrix()
 
-    if save_choice == "Save Label":
-        ids.save_label()
+        # Optional: ROC / PR / FPR-at-recall sweep from cached Stage-1 scores
+        # ids.save_threshold_report()
 
-    ids.show_confusion_matrix()
+    instrument.write_report("observation2")
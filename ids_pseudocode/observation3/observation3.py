@@ -1,4 +1,11 @@
 import os
+import sys
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+# Feature columns (FEATURE_COLS, SEQUENCE_COLS) are defined once, in dataio
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from dataio.dataio import FEATURE_COLS, SEQUENCE_COLS, resolve_feature_cols
 
 
 # ── Constants ─────────────────────────────────────────────────────────────────
@@ -11,20 +18,36 @@ LABEL_MAP = {
     3: 'Replay',  4: 'Fuzzing',  5: 'UDS_Spoofing'
 }
 
-# Feature columns from preprocessing.py
-FEATURE_COLS = [
-    'Arbitration_ID', 'DLC',
-    'Prev_Interver', 'ID_Prev_Interver', 'Data_Prev_Interver',
-    'ID_Frequency', 'Data_Frequency', 'Frequency_diff'
-]
 DROP_COLS = ['Label', 'Class', 'Interface', 'Timestamp', 'Data']
 
+# Training-set sampling (sampler.sample_train); None = use every row
+# e.g. {'strategy': 'class_cap', 'caps': {0: 500_000}, 'seed': 0}
+SAMPLE_CONFIG = None
+
+# Total cores shared by pool workers × per-model n_jobs
+CORE_BUDGET = os.cpu_count()
+
+# Directory for memory-mapped feature arrays shared with grid workers
+SHARED_DIR = os.path.join("source", "AutoHack", "obs3_shared")
+
+# Test rows per evaluation batch (evaluation.py); None = whole test set in memory
+EVAL_BATCH_SIZE = None
+
+# StandardScaler before RF / XGBoost. Tree splits are invariant to per-feature
+# affine scaling, so False skips the scaler's full copy with the feature store.
+SCALE_FEATURES = True
+
 
 # ── Data Loading ──────────────────────────────────────────────────────────────
 
 def load_data(train_path, test_path):
     """
-    Load preprocessed train_proc.csv and test_proc.csv.
+    Load preprocessed train_proc and test_proc (.csv or .parquet).
+    Paths may also be raw split directories: features are then served by
+    the shared feature cache, running processing() only on a miss.
+    Delegates to dataio.load_data() with
+    columns = FEATURE_COLS + SEQUENCE_COLS + ['Label', 'Interface']
+    (Interface for bus filters; missing SEQUENCE_COLS are skipped).
     Returns train_df, test_df.
     """
     pass
@@ -33,7 +56,7 @@ def load_data(train_path, test_path):
 def extract_features(df):
     """
     Separate feature matrix X and label vector y from dataframe.
-    Drop non-feature columns: Label, Class, Interface, Timestamp, Data.
+    X = df[resolve_feature_cols(df)]; DROP_COLS never reach the model.
     Returns X (features), y (Label).
     """
     pass
@@ -44,7 +67,7 @@ def extract_features(df):
 class CANIDSModel:
     """Unified wrapper for RF / XGBoost models."""
 
-    def __init__(self, model_type='RF'):
+    def __init__(self, model_type='RF', n_jobs=1, params=None):
         pass
 
     def build_model(self, input_dim, num_classes):
@@ -53,6 +76,12 @@ class CANIDSModel:
 
         RF      : RandomForestClassifier(n_estimators=100, max_depth=20)
         XGBoost : XGBClassifier(n_estimators=100, max_depth=10, lr=0.1)
+
+        params (tuning.py best_params.json 'obs3_RF' / 'obs3_XGB') overrides
+        these defaults: rf_* / xgb_* keys map to the estimator arguments.
+
+        Both receive n_jobs=self.n_jobs so pool workers × n_jobs stays
+        within CORE_BUDGET.
         """
         pass
 
@@ -64,24 +93,35 @@ class CANIDSModel:
         """Return predicted class indices."""
         pass
 
-    def evaluate(self, X_test, y_test):
+    def evaluate(self, X_test, y_test, arb_id=None, interface=None, batch_size=None):
         """
         Compute accuracy, precision, recall, F1, confusion matrix, report.
         Returns metrics dict including y_pred for downstream per-bus breakdown.
+
+        X_test is scaled (StandardScaler), so the grouping keys come in
+        separately: arb_id (raw Arbitration_ID) and interface (bus index),
+        both split off the test frame before scaling.
+
+        batch_size: predict X_test in slices and feed an
+        evaluation.ConfusionAccumulator (update(y, y_pred, arb_id[s],
+        interface[s]) per slice) instead of keeping y_pred; the metrics
+        dict then carries the accumulator (no y_pred). No test filter is
+        applied — all labels, including UDS_Spoofing, are evaluated.
         """
         pass
 
 
 # ── Per-Bus Training ──────────────────────────────────────────────────────────
 
-def train_and_evaluate_bus(train_df, test_df, bus_type, model_types=MODEL_TYPES):
+def train_and_evaluate_bus(train_df, test_df, bus_type, model_types=MODEL_TYPES, n_jobs=1):
     """
     Train and evaluate using only one bus's data.
 
     Steps:
       1. Filter train/test by Interface == bus_type
+         sampler.sample_train(train, SAMPLE_CONFIG) if set (train only)
       2. extract_features() → X_train, X_test, y_train, y_test
-      3. LabelEncoder + StandardScaler (fit on train only)
+      3. LabelEncoder + StandardScaler (fit on train only; skipped if not SCALE_FEATURES)
       4. Train/Val split (80/20, stratified)
       5. For each model_type: build → train → evaluate
     """
@@ -90,25 +130,95 @@ def train_and_evaluate_bus(train_df, test_df, bus_type, model_types=MODEL_TYPES)
 
 # ── Combined Training ─────────────────────────────────────────────────────────
 
-def train_and_evaluate_combined(train_df, test_df, model_types=MODEL_TYPES):
+def train_and_evaluate_combined(train_df, test_df, model_types=MODEL_TYPES, n_jobs=1):
     """
     Train on all buses combined, then break down results per bus.
 
     Steps:
       1. extract_features() on full train/test (no bus filter)
-      2. LabelEncoder + StandardScaler (fit on train only)
+         sampler.sample_train(train, SAMPLE_CONFIG) first if set (train only)
+         arb_id_test = test_df['Arbitration_ID'], bus_test = Interface as BUSES
+         index — kept raw, before step 2 scales X
+      2. LabelEncoder + StandardScaler (fit on train only; skipped if not SCALE_FEATURES)
       3. Train/Val split (80/20, stratified)
       4. For each model_type: build → train → evaluate
       5. Per-bus breakdown:
            for each bus in [B-CAN, C-CAN, P-CAN]:
                apply bus mask to y_test and y_pred → compute metrics
+         With EVAL_BATCH_SIZE set, evaluate(X_test, y_test, arb_id_test,
+         bus_test, EVAL_BATCH_SIZE) accumulates per-(bus, ID range)
+         confusion matrices in the same pass, and the breakdown is
+         acc.matrix(bus=b) → evaluation.metrics_from_matrix() — no re-masking.
+    """
+    pass
+
+
+# ── Parallel Grid ─────────────────────────────────────────────────────────────
+
+def plan_workers(n_cells, core_budget=CORE_BUDGET, workers=None):
+    """
+    Split the core budget between pool workers and model n_jobs.
+
+      workers = min(workers or n_cells, n_cells, core_budget)
+      n_jobs  = max(1, core_budget // workers)
+    so workers × n_jobs <= core_budget (no oversubscription), also when
+    --workers asks for more processes than cores or cells
+    (--workers 32 --cores 16 → 16 workers × 1 job).
+    Also sets OMP_NUM_THREADS=n_jobs in each worker for XGBoost.
+    Returns workers, n_jobs.
+    """
+    pass
+
+
+def share_features(train_df, test_df, shared_dir=SHARED_DIR, store=None):
+    """
+    Load-once, share-everywhere feature arrays.
+
+    With a feature store descriptor (store), nothing is written: the
+    descriptor itself is returned as the spec, and workers attach to the
+    shared memory and take zero-copy store.view(split, bus) blocks.
+
+    Writes to shared_dir with np.save:
+      X_train.npy / X_test.npy  (float32, resolve_feature_cols(train_df))
+      y_train.npy / y_test.npy  (Label)
+      bus_train.npy / bus_test.npy  (Interface as index into BUSES)
+    Returns a small spec dict (paths) that is cheap to pickle to workers.
+    Workers open the arrays with np.load(path, mmap_mode='r') — pages are
+    shared through the OS page cache, not copied per process.
+    """
+    pass
+
+
+def run_cell(spec, bus_type, model_type, n_jobs):
+    """
+    Worker entry point for one grid cell.
+
+    bus_type in BUSES → same steps as train_and_evaluate_bus() on the
+                        bus-masked memmap rows (or store.view(split, bus_type))
+    bus_type == 'ALL' → same steps as train_and_evaluate_combined(),
+                        including the per-bus breakdown
+    Returns a list of summary rows: (experiment, bus, model, Accuracy,
+    Precision, Recall, F1).
+    """
+    pass
+
+
+def run_grid(train_df, test_df, core_budget=CORE_BUDGET, workers=None):
+    """
+    Run the BUSES × MODEL_TYPES grid plus the combined models in parallel.
+
+    1. spec  = share_features(train_df, test_df)
+    2. cells = [(bus, model) for bus in BUSES + ['ALL'] for model in MODEL_TYPES]
+    3. workers, n_jobs = plan_workers(len(cells), core_budget, workers)
+    4. ProcessPoolExecutor(workers).submit(run_cell, spec, bus, model, n_jobs)
+    5. Collect results and sort in grid order → summary DataFrame
     """
     pass
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 
-def main():
+def main(workers=1, core_budget=CORE_BUDGET, profile=False, store=None):
     """
     Execution flow:
 
@@ -120,9 +230,33 @@ def main():
          train_and_evaluate_combined()   → includes per-bus breakdown
     4. Print summary table:
          bus × model → Accuracy / Precision / Recall / F1
+
+    workers > 1 replaces steps 2–3 with run_grid(): every bus × model cell
+    (and each combined model) runs in its own process within core_budget.
+
+    Model params come from tuning.load_best() ('obs3_RF' / 'obs3_XGB')
+    when a search has been run, else the build_model() defaults.
+
+    store: feature store descriptor — load_data() is skipped and every
+    cell (local or pool worker) uses zero-copy views of the shared matrix.
+
+    Each cell's training and evaluation run inside instrument.stage();
+    the timing report is written to report/timing/observation3_{timestamp}.json.
+    profile=True also dumps a cProfile .prof.
     """
     pass
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Observation 3 — multi-bus comparison")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="grid cells trained in parallel (1 = sequential)")
+    parser.add_argument("--cores", type=int, default=CORE_BUDGET,
+                        help="total core budget shared by workers and model n_jobs")
+    parser.add_argument("--profile", action="store_true",
+                        help="dump a cProfile .prof next to the timing report")
+    parser.add_argument("--store", default=None,
+                        help="feature store descriptor (featurestore.py serve)")
+    args = parser.parse_args()
+
+    main(workers=args.workers, core_budget=args.cores, profile=args.profile, store=args.store)
@@ -0,0 +1,150 @@
+import os
+import sys
+import time
+import argparse
+
+# Feature columns (FEATURE_COLS, SEQUENCE_COLS) are defined once, in dataio
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from dataio.dataio import FEATURE_COLS, SEQUENCE_COLS, resolve_feature_cols
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+BUSES = ['B-CAN', 'C-CAN', 'P-CAN']
+
+LABEL_MAP = {
+    0: 'Normal',  1: 'Flooding', 2: 'Spoofing',
+    3: 'Replay',  4: 'Fuzzing',  5: 'UDS_Spoofing'
+}
+
+# Full bus load: ~4,500 frames/s on a 500 kbit/s bus with 8-byte frames
+FULL_LOAD_FPS = 4_500
+TARGET_FPS    = FULL_LOAD_FPS * len(BUSES)   # three buses on one core
+
+BATCH_SIZE  = 64                             # frames per micro-batch (1 = per-frame)
+PERCENTILES = [50, 90, 99, 99.9]
+
+
+# ── Replay Source ─────────────────────────────────────────────────────────────
+
+def replay_source(csv_path, speed=1.0, batch_size=BATCH_SIZE):
+    """
+    Replay a raw label CSV (Interface, Timestamp, Arbitration_ID, DLC, Data, Label)
+    as a live frame source.
+
+    speed      : 1.0 = real time, 10.0 = 10x accelerated,
+                 None or <= 0 = unthrottled (as fast as possible, no sleep)
+    batch_size : frames yielded together (1 = frame by frame)
+
+    Steps:
+      1. Read the CSV in chunks (pd.read_csv(chunksize=..., dtype={'Arbitration_ID': str,
+         'Data': str})) — never fully in memory; hex fields stay strings in every chunk
+      2. Per-frame arrival time (int64 ns, one entry per frame):
+           throttled   : wall_start_ns + (Timestamp_i − Timestamp_first) × 1e9 / speed
+                         — the moment frame i would arrive on the bus
+           unthrottled : time.perf_counter_ns() when frame i is taken from the reader
+                         (no division by speed)
+      3. Throttled: sleep until the arrival time of the batch's last frame,
+         so the batch is released when it would be complete on the bus
+      4. Yield (frames, arrival_ns) — arrival_ns is the per-frame array, so
+         time spent waiting for the batch to fill counts toward each
+         earlier frame's latency
+    """
+    pass
+
+
+# ── Latency ───────────────────────────────────────────────────────────────────
+
+class LatencyRecorder:
+    """
+    Per-frame latency log: arrival (replay release) → final decision.
+
+    Latencies are stored in a preallocated, growable int64 array of
+    nanoseconds, so recording does not allocate per frame.
+    """
+
+    def __init__(self, capacity=1_000_000):
+        pass
+
+    def record(self, arrival_ns):
+        """
+        Record one latency per frame of a micro-batch:
+          latency[i] = now − arrival_ns[i]   (vectorized, now = perf_counter_ns())
+        The first frame of a batch includes the wait for the remaining
+        frames, so percentiles reflect batching delay as well as scoring.
+        """
+        pass
+
+    def summary(self, elapsed_sec):
+        """
+        Returns dict:
+          frames, elapsed_sec, fps (frames / elapsed_sec),
+          p50 / p90 / p99 / p99.9 latency in µs (np.percentile over PERCENTILES),
+          realtime = fps >= TARGET_FPS
+        """
+        pass
+
+
+# ── Online Detector ───────────────────────────────────────────────────────────
+
+class OnlineIDS:
+    """
+    Online two-stage detector built on observation2.IDSModel.
+
+    Execution flow per micro-batch:
+      1. StreamingFeatureEngine.update() per frame  (preprocessing.py)
+           → incremental features, same values as offline processing()
+      2. Stage 1: clf_C.predict(X)                  → Normal / Attack
+      3. Stage 2: clf_S.predict(X[attack_mask])     → attack type
+           only frames flagged by Stage 1 reach clf_S
+      4. Merge → Predict_Class / Predict_Label per frame
+      5. LatencyRecorder.record(arrival_ns)   (per-frame arrival times)
+    """
+
+    def __init__(self, clf_C, clf_S, batch_size=BATCH_SIZE, sequence_depth=0):
+        # One StreamingFeatureEngine(sequence_depth=sequence_depth) for all buses:
+        # processing() keys state by Arbitration_ID and (ID, Data), not by Interface
+        # sequence_depth must be the --sequence-depth the training data used;
+        # ValueError if the model expects SEQUENCE_COLS and sequence_depth == 0
+        # (or the other way round)
+        # feature_cols = resolve_feature_cols(clf_C.feature_names_in_) — the columns and
+        # order the model was trained on, window-suffixed when WINDOW_SIZES is not the default
+        # Preallocate the (batch_size, len(feature_cols)) float32 feature buffer
+        pass
+
+    def process_batch(self, frames, arrival_ns):
+        """
+        Score one micro-batch (steps 1–5 above).
+        Returns (pred_class, pred_label) arrays aligned with frames.
+        """
+        pass
+
+    def run(self, source):
+        """
+        Consume a frame source (e.g. replay_source()) until exhausted.
+        Optionally appends predictions to a labeled CSV.
+        Returns LatencyRecorder.summary().
+        """
+        pass
+
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+def main():
+    """
+    Execution flow:
+
+    1. Parse args: --test (raw test label CSV), --name (model name),
+                   --speed (1.0 real time; 0 or negative = unthrottled), --batch-size,
+                   --sequence-depth (same N as preprocessing; 0 = off)
+       speed <= 0 is passed to replay_source() as None
+    2. Load clf_C / clf_S (IDS_Model/IDS/{name}_C.pkl, {name}_S.pkl)
+    3. OnlineIDS(clf_C, clf_S, batch_size, sequence_depth).run(replay_source(...))
+    4. Print summary: fps vs TARGET_FPS, latency percentiles
+    5. Save summary → report/online/{name}_latency.json
+    """
+    pass
+
+
+if __name__ == "__main__":
+    main()
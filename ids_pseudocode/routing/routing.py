@@ -0,0 +1,201 @@
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# Feature columns (FEATURE_COLS, SEQUENCE_COLS) are defined once, in dataio
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from dataio.dataio import FEATURE_COLS, SEQUENCE_COLS, resolve_feature_cols
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+BUSES = ['B-CAN', 'C-CAN', 'P-CAN']
+
+LABEL_MAP = {
+    0: 'Normal', 1: 'DoS', 2: 'Spoofing',
+    3: 'Replay',  4: 'Fuzzing',  5: 'UDS_Spoofing'
+}
+
+# Arbitration_ID threshold for UDS diagnostic range (0x700 = 1792)
+UDS_ID_THRESHOLD = 1792
+
+# Period table: accepted band around each ID's normal ID_Prev_Interver
+PERIOD_QUANTILES = (0.001, 0.999)   # band = these quantiles of Normal rows …
+PERIOD_TOLERANCE = 0.05             # … widened by ±5 %
+PERIOD_MIN_ROWS  = 1_000            # IDs with fewer Normal rows are never table-checked
+
+# Route models (small RF per group) and the confidence below which a frame
+# falls through to the full ensemble
+ROUTE_PARAMS   = {'n_estimators': 20, 'max_depth': 10}
+MIN_CONFIDENCE = 0.95
+
+# Route codes (per-frame, also used in the report)
+ROUTE_TABLE, ROUTE_UDS, ROUTE_BUS, ROUTE_FULL = 0, 1, 2, 3
+ROUTE_NAMES = ['period_table', 'uds_model', 'bus_model', 'full_ensemble']
+
+REPORT_PATH = os.path.join("report", "routing")
+
+
+# ── Period Table ──────────────────────────────────────────────────────────────
+
+def build_period_table(train_df):
+    """
+    Expected-period table for trivially periodic IDs (Arbitration_ID < UDS_ID_THRESHOLD).
+
+    For each ID with at least PERIOD_MIN_ROWS Normal training rows:
+      lo, hi       = quantiles PERIOD_QUANTILES of ID_Prev_Interver (Normal rows),
+                     widened by PERIOD_TOLERANCE
+      dlc          = the ID's DLC (IDs with more than one DLC are skipped)
+      freq_lo/hi   = min / max ID_Frequency of Normal rows
+                     (with multi-window output: the WINDOW_SIZE-suffixed column)
+
+    An ID is kept only if the check is exact on the training set: no attack
+    row of that ID passes it (injected frames shorten ID_Prev_Interver and
+    raise ID_Frequency, so Spoofing / Replay / DoS rows on a periodic ID
+    fall outside the band).
+
+    Returns a dense lookup indexed by Arbitration_ID (0x000–0x7FF):
+      valid (bool), lo, hi (float32), dlc (uint8), freq_lo, freq_hi (uint32)
+    """
+    pass
+
+
+def period_check(table, X, arb_id):
+    """
+    Vectorized exact check on a feature batch.
+
+    X      : unscaled features (the table bands are raw ID_Prev_Interver /
+             DLC / ID_Frequency values)
+    arb_id : raw integer Arbitration_ID per row, taken from the frame before
+             any StandardScaler — never read back out of a scaled X
+
+      ids = arb_id
+      ok  = table.valid[ids]
+            & (lo[ids] <= ID_Prev_Interver <= hi[ids])
+            & (DLC == dlc[ids])
+            & (freq_lo[ids] <= ID_Frequency <= freq_hi[ids])
+
+    Rows with ok=True are predicted Normal (class 0) without any model.
+    Cost is a few array lookups per frame.
+    """
+    pass
+
+
+# ── Route Models ──────────────────────────────────────────────────────────────
+
+def train_route_models(train_df, params=ROUTE_PARAMS, n_jobs=1):
+    """
+    Small models for frames the table cannot settle.
+
+      uds_model        : RF(params) on rows with Arbitration_ID >= UDS_ID_THRESHOLD
+      bus_model[bus]   : RF(params) per bus in BUSES on the remaining rows,
+                         excluding rows the period table accepts
+                         (when Interface is absent, one model for all buses)
+
+    Each model is trained on its own group only, so it is much smaller
+    than the monolithic CANIDSModel.build_model() forest.
+    Returns {'uds': model, 'bus': {bus: model}}.
+    """
+    pass
+
+
+# ── Router ────────────────────────────────────────────────────────────────────
+
+class RoutedIDS:
+    """
+    Frame router in front of the full ensemble.
+
+      1. period_check()                 → Normal, done          (ROUTE_TABLE)
+      2. ID >= UDS_ID_THRESHOLD         → uds_model             (ROUTE_UDS)
+         else                           → bus_model[Interface]  (ROUTE_BUS)
+      3. max predict_proba < MIN_CONFIDENCE
+                                        → full ensemble         (ROUTE_FULL)
+
+    Each stage runs once per batch on the rows routed to it (boolean index
+    per route), so model calls stay vectorized.
+    """
+
+    def __init__(self, full_model, min_confidence=MIN_CONFIDENCE, scaler=None):
+        """
+        scaler: the full model's fitted StandardScaler (observation3 with
+        SCALE_FEATURES), applied only to the ROUTE_FULL rows; the table and
+        route models work on unscaled features.
+        """
+        pass
+
+    def fit(self, train_df, n_jobs=1):
+        """ build_period_table() + train_route_models(); the full model is trained separately. """
+        pass
+
+    def predict(self, X, arb_id, interface=None):
+        """
+        X: unscaled features; arb_id: raw Arbitration_ID per row (routes
+        step 1 and 2); interface: bus per row (step 2), None = one bus model.
+        Returns pred (int array) and route (uint8 array of ROUTE_* codes).
+        The full model only sees rows that reached ROUTE_FULL.
+        """
+        pass
+
+    def route_counts(self, route):
+        """ Rows per route name — how much traffic skipped the full ensemble. """
+        pass
+
+
+# ── Comparison ────────────────────────────────────────────────────────────────
+
+def compare_monolithic(routed, full_model, X_test, y_test, arb_id, interface=None,
+                       scaler=None, repeat=3):
+    """
+    Routed vs monolithic on the same test set.
+
+    X_test is unscaled: routed.predict(X_test, arb_id, interface); the
+    monolithic model gets scaler.transform(X_test) when a scaler is given.
+
+    For each predictor (best of `repeat`, wall clock):
+      rows_per_sec, accuracy, macro precision / recall / F1
+      (evaluation.metrics_from_matrix on the confusion matrix)
+    For the routed model also:
+      route share (% of rows per ROUTE_NAMES entry)
+      per-route accuracy, and the number of disagreements with the
+      monolithic prediction per route
+
+    Returns a list of dicts: predictor, rows_per_sec, accuracy, f1_macro,
+    and the route columns.
+    """
+    pass
+
+
+def save_comparison(results, name):
+    """ Write {REPORT_PATH}/{name}_routing.csv and the period table ({name}_period_table.csv). """
+    pass
+
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+def main(train_path, test_path, n_jobs=1):
+    """
+    Execution flow:
+
+    1. dataio.load_data(train_path, test_path) (Interface kept when present)
+       X = df[resolve_feature_cols(train_df)] for every model below
+       arb_id = df['Arbitration_ID'].to_numpy() — raw, split off before scaling
+    2. Full ensemble: observation3 CANIDSModel('RF', n_jobs).build_model → train
+       (StandardScaler fit on train when observation3 SCALE_FEATURES is set)
+    3. RoutedIDS(full_model, scaler=scaler).fit(train_df)
+    4. compare_monolithic() on the test set
+    5. Print table: predictor → rows/s / accuracy / F1 / route share
+    6. save_comparison()
+    """
+    pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-ID / per-bus routed IDS vs monolithic model")
+    parser.add_argument("--train", required=True, help="train proc file")
+    parser.add_argument("--test", required=True, help="test proc file")
+    parser.add_argument("--n-jobs", type=int, default=1, help="n_jobs for all models")
+    args = parser.parse_args()
+
+    main(args.train, args.test, n_jobs=args.n_jobs)
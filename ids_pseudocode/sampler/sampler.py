@@ -0,0 +1,87 @@
+import time
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+STRATEGIES = ['class_cap', 'stratified_id', 'time_block']
+
+# Example configs — pass one as SAMPLE_CONFIG in an observation (None = all rows)
+DEFAULT_CONFIGS = {
+    'class_cap'    : {'strategy': 'class_cap', 'caps': {0: 500_000}, 'seed': 0},
+    'stratified_id': {'strategy': 'stratified_id', 'frac': 0.1, 'min_per_stratum': 200, 'seed': 0},
+    'time_block'   : {'strategy': 'time_block', 'block_size': 10_000, 'normal_frac': 0.1, 'seed': 0},
+}
+
+
+# ── Strategies ────────────────────────────────────────────────────────────────
+
+def sample_class_cap(df, caps, seed=0):
+    """
+    Per-class caps on Label.
+
+    caps: {label: max rows}; labels not listed are kept in full.
+    For each capped label with more rows than its cap, draw cap rows
+    without replacement (np.random.default_rng(seed)).
+    Returns the selected row positions.
+    """
+    pass
+
+
+def sample_stratified_id(df, frac, min_per_stratum=0, seed=0):
+    """
+    Stratified by (Interface, Arbitration_ID, Label).
+
+    Every stratum keeps max(ceil(frac × size), min(size, min_per_stratum))
+    rows, so rare IDs and rare attack/ID combinations are never dropped.
+    Interface is left out of the key when the column is absent.
+    Returns the selected row positions.
+    """
+    pass
+
+
+def sample_time_block(df, block_size, normal_frac, seed=0):
+    """
+    Contiguous time blocks, preserving attack context.
+
+    Rows of a proc file are in capture order (Timestamp is dropped in
+    preprocessing step 6, so row order is the time axis).
+      1. Cut rows into blocks of block_size consecutive rows
+      2. Keep every block that contains any attack row (Label != 0)
+           → Replay / Spoofing keep the surrounding normal traffic
+      3. Keep a normal_frac random share of all-Normal blocks
+    Returns the selected row positions.
+    """
+    pass
+
+
+def sample_train(df, config):
+    """
+    Apply a sampling config to a training DataFrame.
+
+    config: None (no sampling) or dict with 'strategy' in STRATEGIES plus
+    that strategy's arguments (see DEFAULT_CONFIGS).
+    Selected positions are sorted, so the original row order is kept.
+    Returns the sampled DataFrame only, so call sites use it as a frame
+    (train_df = sample_train(train_df, config)). The rows before / after
+    per Label are printed as a small table; sampling_tradeoff() reports
+    train_rows itself.
+    """
+    pass
+
+
+# ── Tradeoff Report ───────────────────────────────────────────────────────────
+
+def sampling_tradeoff(train_df, test_df, fit, score, configs=DEFAULT_CONFIGS):
+    """
+    Accuracy-versus-training-time table for a set of sampling configs.
+
+    fit(train_df) → model          (e.g. wraps observation1.train_binary)
+    score(model, test_df) → dict   (accuracy, macro-F1)
+
+    For None (full data) and each config:
+      sampled = sample_train(train_df, config)
+      time fit() with time.perf_counter(); score on the unsampled test set
+    Returns a DataFrame: config, train_rows, train_seconds, accuracy, macro_f1,
+    speedup vs full data.
+    """
+    pass
@@ -0,0 +1,119 @@
+import os
+import argparse
+import numpy as np
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+BUSES   = ['B-CAN', 'C-CAN', 'P-CAN']
+COLUMNS = ['Interface', 'Timestamp', 'Arbitration_ID', 'DLC', 'Data', 'Label']
+
+# Bump when generated output changes, so cached benchmark inputs are rebuilt
+GENERATOR_VERSION = 1
+
+# Periodic traffic per bus: number of IDs and period range (seconds)
+BUS_PROFILE = {
+    'B-CAN': {'n_ids': 40, 'period': (0.1, 1.0)},
+    'C-CAN': {'n_ids': 60, 'period': (0.01, 0.5)},
+    'P-CAN': {'n_ids': 50, 'period': (0.01, 0.1)},
+}
+
+# Aperiodic UDS normal traffic (Arbitration_ID >= 0x700), per bus
+UDS_NORMAL = {'ids': [0x7DF, 0x7E0, 0x7E8], 'sessions_per_min': 2, 'frames_per_session': 20}
+
+# Injected attacks: bursts per minute per bus, frames per burst, injection rate (Hz)
+ATTACK_CONFIG = {
+    'DoS'         : {'bursts_per_min': 1.0, 'burst_frames': 2_000, 'rate_hz': 4_000},
+    'Spoofing'    : {'bursts_per_min': 1.0, 'burst_frames':   500, 'rate_hz':   200},
+    'Replay'      : {'bursts_per_min': 1.0, 'burst_frames':   500, 'rate_hz':   100},
+    'Fuzzing'     : {'bursts_per_min': 1.0, 'burst_frames': 1_000, 'rate_hz': 1_000},
+    'Spoofing_UDS': {'bursts_per_min': 0.5, 'burst_frames':   100, 'rate_hz':    50},
+}
+
+BLOCK_SEC = 10.0      # traffic is generated and written one time block at a time
+
+
+# ── Traffic Model ─────────────────────────────────────────────────────────────
+
+def make_bus_schedule(bus, seed):
+    """
+    Fixed description of one bus's normal traffic.
+
+    For each of BUS_PROFILE[bus]['n_ids'] IDs (< 0x700, unique across buses):
+      period   : drawn from the bus's period range
+      phase    : uniform in [0, period)
+      jitter   : ~1% of period (Gaussian)
+      DLC      : 2–8
+      payloads : small pool per ID with a rolling counter byte, so
+                 (ID, Data) pairs repeat like real periodic signals
+    """
+    pass
+
+
+def periodic_frames(schedule, t0, t1, rng):
+    """ Normal frames of one bus in [t0, t1): arange(phase, …, period) + jitter per ID. """
+    pass
+
+
+def uds_normal_frames(bus, t0, t1, rng):
+    """
+    Aperiodic diagnostic sessions (Label 'Normal', ID in UDS_NORMAL['ids']):
+    Poisson session starts, request/response pairs with random gaps.
+    """
+    pass
+
+
+def attack_frames(bus, schedule, history, t0, t1, rng, config=ATTACK_CONFIG):
+    """
+    Injected bursts in [t0, t1), Poisson starts at bursts_per_min.
+
+      DoS          : ID 0x000, constant payload, at rate_hz         → 'DoS'
+      Spoofing     : existing periodic ID, forged payload           → 'Spoofing'
+      Replay       : re-send a recorded window of earlier frames of
+                     one ID from `history`, timing preserved        → 'Replay'
+      Fuzzing      : random ID (incl. >= 0x700), random DLC/payload → 'Fuzzing'
+      Spoofing_UDS : forged diagnostic requests on 0x7DF / 0x7E0    → 'Spoofing_UDS_{service}'
+    """
+    pass
+
+
+# ── Generator ─────────────────────────────────────────────────────────────────
+
+def generate_blocks(n_frames, seed=0, config=ATTACK_CONFIG):
+    """
+    Yield raw-log DataFrames (COLUMNS) one BLOCK_SEC block at a time until
+    n_frames frames have been produced.
+
+    Per block:
+      1. Normal + UDS normal + attack frames for every bus
+      2. Merge and sort by Timestamp (np.argsort on the block only)
+      3. Format: Arbitration_ID as upper-case hex ("7FF"),
+                 Data as space-separated hex bytes ("40 B2 81 14")
+    Memory is bounded by one block; Replay history keeps only the last
+    few seconds per ID.
+    Deterministic for a given (n_frames, seed, config, GENERATOR_VERSION).
+    """
+    pass
+
+
+def generate_capture(path, n_frames, seed=0, config=ATTACK_CONFIG):
+    """
+    Write a synthetic autohack_*_label_interface.csv to path.
+    Blocks from generate_blocks() are appended (header once).
+    Returns the per-Label frame counts.
+    """
+    pass
+
+
+def main():
+    """
+    CLI: python synthetic.py --frames 10000000 --seed 0 --out dataset/Synthetic/...
+
+    Writes train and test captures (different seeds) in the
+    dataset/.../Interface/{train,test}/ layout expected by preprocessing.py.
+    """
+    pass
+
+
+if __name__ == "__main__":
+    main()
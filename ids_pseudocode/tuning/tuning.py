@@ -0,0 +1,293 @@
+import os
+import json
+import math
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+
+# ── Constants ─────────────────────────────────────────────────────────────────
+
+# Search targets and the models they tune
+#   C        : observation2 IDSModel.clf_C   (binary, Normal vs Attack)
+#   S        : observation2 IDSModel.clf_S   (multi-class, subclass 0–4 incl. Normal)
+#   obs3_RF  : observation3 CANIDSModel('RF').build_model
+#   obs3_XGB : observation3 CANIDSModel('XGBoost').build_model
+TARGETS = ['C', 'S', 'obs3_RF', 'obs3_XGB']
+
+# Successive halving: keep the best 1/ETA of configs per rung,
+# give survivors ETA× the resource
+ETA = 3
+
+# Resource = share of the training rows and of each config's tree count.
+# A rung with resource r trains ceil(r × n_estimators) trees on r × n_train rows.
+MIN_RESOURCE = 1 / 27
+MAX_RESOURCE = 1.0
+
+# Validation split (stratified) and objective
+VAL_FRAC  = 0.2
+OBJECTIVE = 'f1_macro'
+
+SEED = 0
+
+# Total cores shared by pool workers × per-model n_jobs (see observation3.plan_workers)
+CORE_BUDGET = os.cpu_count()
+
+TUNING_DIR  = os.path.join("source", "AutoHack", "tuning")
+# One checkpoint per target, training capture and search configuration
+# ({digest} = run_digest()), so resuming against another capture or after
+# editing SEARCH_SPACE / ETA / MIN_RESOURCE / SEED never mixes in old trials
+CHECKPOINT  = os.path.join(TUNING_DIR, "{target}_{digest}_trials.jsonl")
+BEST_PARAMS = os.path.join(TUNING_DIR, "best_params.json")
+
+
+# ── Search Space ──────────────────────────────────────────────────────────────
+
+# Keys use the names the models already consume (best_C / best_S style)
+SEARCH_SPACE = {
+    'rf' : {
+        'rf_n_estimators'     : [50, 100, 130, 170, 250, 400],
+        'rf_max_depth'        : [10, 15, 20, 30, None],
+        'rf_min_samples_leaf' : [1, 2, 5],
+        'rf_max_features'     : ['sqrt', 0.5, 1.0],
+    },
+    'xgb': {
+        'xgb_n_estimators'  : [50, 100, 200, 400],
+        'xgb_max_depth'     : [4, 6, 8, 10, 12],
+        'xgb_learning_rate' : [0.03, 0.1, 0.3],
+        'xgb_subsample'     : [0.7, 1.0],
+    },
+}
+
+TARGET_SPACE = {'C': 'rf', 'S': 'rf', 'obs3_RF': 'rf', 'obs3_XGB': 'xgb'}
+
+
+def sample_configs(space, n, seed):
+    """
+    Draw n distinct configs from a space (np.random.default_rng(seed)).
+    Config ids are the draw index, so the same seed regenerates the same
+    configs — required for resuming from a checkpoint.
+    Returns [(config_id, params)].
+    """
+    pass
+
+
+# ── Checkpoint ────────────────────────────────────────────────────────────────
+
+def trial_key(bracket, rung, config_id):
+    return f"{bracket}:{rung}:{config_id}"
+
+
+def train_digest(train_path):
+    """
+    First 16 hex chars of featurecache.file_digest(train_path); recorded
+    in best_params.json _meta.
+    """
+    pass
+
+
+def search_digest(target):
+    """
+    First 16 hex chars of the SHA-256 of everything that decides which
+    params a trial key (bracket:rung:config_id) stands for:
+      json.dumps({'space': SEARCH_SPACE[TARGET_SPACE[target]], 'eta': ETA,
+                  'min_resource': MIN_RESOURCE, 'max_resource': MAX_RESOURCE,
+                  'val_frac': VAL_FRAC, 'objective': OBJECTIVE, 'seed': SEED},
+                 sort_keys=True, default=str)
+    """
+    pass
+
+
+def run_digest(train_path, target):
+    """
+    First 16 hex chars of sha256(train_digest(train_path) + search_digest(target))
+    — the {digest} of CHECKPOINT.
+    """
+    pass
+
+
+def load_checkpoint(path):
+    """
+    Completed trials from a JSON-lines checkpoint: {trial_key: result}.
+    A truncated last line (interrupted write) is ignored.
+    Missing file → {}.
+    """
+    pass
+
+
+def append_checkpoint(path, key, result):
+    """
+    Append one finished trial as a JSON line and flush + os.fsync, so a
+    killed search loses at most the trials still running.
+    """
+    pass
+
+
+# ── Trials ────────────────────────────────────────────────────────────────────
+
+def load_features(train_path, store=None):
+    """
+    Load the training features once for all targets of a run.
+
+    X     = df[dataio.resolve_feature_cols(df)] — the same columns the
+            observations train on — every training row, float32
+    label = df['Label'], arb_id = df['Arbitration_ID']
+
+    The arrays are shared with workers through the feature store
+    (featurestore.publish / attach; store.view('train')) when store is
+    given, else through np.save + mmap_mode='r' as in
+    observation3.share_features(). Returns a small handle dict.
+    """
+    pass
+
+
+def prepare_data(target, data):
+    """
+    Per-target rows and labels over the shared matrix from load_features();
+    X is never reloaded or copied here.
+
+      C        : rows = filters.TRAIN_FILTER.mask_arrays(
+                          {'Label': label, 'Arbitration_ID': arb_id})
+                          (observation2 filter_train)
+                 y = (label[rows] != 0)                → Class
+      S        : same rows, y = label[rows]            → subclass 0–4, Normal
+                 included, exactly as IDSModel.train_model_s fits clf_S
+                 (observation2 extract_features() y_subclass)
+      obs3_*   : all rows, y = LabelEncoder().fit_transform(label)
+
+    Stratified VAL_FRAC split on y, then a fixed row permutation (SEED) of
+    the fit part, so a resource-r subset is simply the first r × n rows —
+    nested across rungs, no re-sampling per trial. Only the row index and
+    y arrays are new (shared the same way as X).
+    Returns a small spec dict (cheap to pickle).
+    """
+    pass
+
+
+def build_estimator(target, params, resource, n_jobs):
+    """
+    Model for one trial, mapped from the search keys:
+      rf_*  → RandomForestClassifier(n_estimators=ceil(resource × rf_n_estimators),
+                                     max_depth, min_samples_leaf, max_features)
+      xgb_* → XGBClassifier(n_estimators=ceil(resource × xgb_n_estimators),
+                            max_depth, learning_rate, subsample)
+    random_state=SEED, n_jobs=n_jobs.
+    """
+    pass
+
+
+def run_trial(spec, target, config_id, params, resource, n_jobs):
+    """
+    Worker entry point.
+
+    1. Attach to the shared arrays in spec (no copy)
+    2. Fit build_estimator() on X[fit_rows[:resource × n_fit]]
+    3. Score OBJECTIVE on the full validation split
+    Returns {'config_id', 'params', 'resource', 'score', 'fit_seconds'}.
+    """
+    pass
+
+
+# ── Successive Halving ────────────────────────────────────────────────────────
+
+def successive_halving(spec, target, configs, min_resource, bracket, pool, n_jobs, done, checkpoint):
+    """
+    One successive-halving run.
+
+      r = min_resource
+      while configs:
+          results = run_trial() for every config at resource r
+                    (submitted together to the pool; trials already in
+                    `done` are read from the checkpoint instead)
+          if r >= MAX_RESOURCE or len(configs) == 1: stop
+          configs = top len(configs) // ETA by score (ties: lower resource
+                    cost, then config_id)
+          r = min(r × ETA, MAX_RESOURCE)
+
+    Every finished trial is appended to the checkpoint as it completes.
+    Returns all results of the run.
+    """
+    pass
+
+
+# ── Hyperband ─────────────────────────────────────────────────────────────────
+
+def hyperband(spec, target, core_budget=CORE_BUDGET, workers=None, resume=True, seed=SEED):
+    """
+    Hyperband over successive-halving brackets.
+
+      s_max = floor(log_ETA(MAX_RESOURCE / MIN_RESOURCE))
+      for s in s_max … 0:
+          n = ceil((s_max + 1) / (s + 1) × ETA ** s)   configs
+          r = MAX_RESOURCE × ETA ** -s                  starting resource
+          successive_halving(..., sample_configs(space, n, seed + s), r, bracket=s)
+
+    Workers and per-trial n_jobs come from the same split as
+    observation3.plan_workers() (workers × n_jobs <= core_budget).
+    With resume=True, trials found in the checkpoint are not re-run; the
+    deterministic config draws make the brackets continue where they stopped.
+
+    Returns the best result trained at MAX_RESOURCE.
+    """
+    pass
+
+
+# ── Output ────────────────────────────────────────────────────────────────────
+
+def save_best(target, best, path=BEST_PARAMS):
+    """
+    Merge the winner into best_params.json:
+
+      {
+        "best_C"  : {"rf_n_estimators": 170, "rf_max_depth": 15, ...},
+        "best_S"  : {"rf_n_estimators": 130, "rf_max_depth": 30, ...},
+        "obs3_RF" : {...},
+        "obs3_XGB": {...},
+        "_meta"   : {target: {score, objective, train_path, train_digest,
+                              search_digest, date}}
+      }
+
+    best_C / best_S are the dicts observation2 IDSModel.__init__ loads
+    (train_model_c / train_model_s read rf_n_estimators / rf_max_depth);
+    obs3_* are passed to CANIDSModel(..., params=...).build_model().
+    """
+    pass
+
+
+def load_best(path=BEST_PARAMS):
+    """ best_params.json as a dict, or {} if no search has been run. """
+    pass
+
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+def main(train_path, targets=TARGETS, core_budget=CORE_BUDGET, workers=None, resume=True, store=None):
+    """
+    Execution flow:
+
+    0. load_features(train_path, store) — the train file is read once
+    For each target:
+      1. prepare_data(target, data) → row index + labels over that matrix
+      2. hyperband()      → checkpointed to CHECKPOINT
+                            (target, run_digest(train_path, target))
+      3. save_best()      → best_params.json
+      4. Print table: bracket × rung → configs / resource / best score
+    """
+    pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hyperband search for observation model params")
+    parser.add_argument("--train", required=True, help="train proc file")
+    parser.add_argument("--targets", nargs="+", default=TARGETS, choices=TARGETS)
+    parser.add_argument("--cores", type=int, default=CORE_BUDGET,
+                        help="total core budget shared by workers and model n_jobs")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="trials run in parallel (default: from the core budget)")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="ignore existing checkpoints and start over")
+    parser.add_argument("--store", default=None,
+                        help="feature store descriptor (featurestore.py serve)")
+    args = parser.parse_args()
+
+    main(args.train, targets=args.targets, core_budget=args.cores, workers=args.workers,
+         resume=not args.no_resume, store=args.store)
@@ -1,13 +1,48 @@
 import os
+import sys
+import argparse
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 from tqdm import tqdm
 
+# Output schema (PROC_DTYPES, SEQUENCE_COLS) is defined once, in ids_pseudocode/dataio
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ids_pseudocode"))
+from dataio.dataio import PROC_DTYPES, SEQUENCE_COLS, proc_dtypes
+
 # ── Parameters ───────────────────────────────────────────────
 TIME_SIZE   = 10          # Default interval fill value (seconds)
 WINDOW_SIZE = f'{TIME_SIZE}s'  # Rolling window size for frequency features
+WINDOW_SIZES = [WINDOW_SIZE]   # Windows computed in one pass, e.g. ['0.1s', '1s', '10s', '60s']
+FREQUENCY_BACKEND = 'rolling'  # Step 5 backend: 'rolling' (pandas) or 'searchsorted' (NumPy)
+OUTPUT_FORMAT = 'csv'          # {split}_proc output: 'csv' or 'parquet'
+CHUNK_SIZE  = None             # Rows per chunk for out-of-core mode (None = whole file)
+SEQUENCE_DEPTH = 0             # Per-ID ring buffer depth N for payload sequence features (0 = off)
+PREPROCESSING_VERSION = 1      # Bump whenever processing() output changes (feature cache key)
+
+# Payload byte columns emitted by decode_hex_columns(byte_columns=True)
+BYTE_COLS = [f'Byte_{i}' for i in range(8)]
+
+# Raw label CSV read dtypes: hex fields stay strings. Without this, pandas infers
+# all-digit IDs / payloads (e.g. "329") as int64 — per chunk in chunked mode.
+RAW_DTYPES = {'Arbitration_ID': str, 'Data': str}
+
+
+def frequency_columns(window_sizes=WINDOW_SIZES):
+    """
+    Output names of the step-5 features for a list of windows.
+
+    [WINDOW_SIZE] (default)  → ID_Frequency, Data_Frequency, Frequency_diff
+                               (unsuffixed, same as the single-window output)
+    any other list           → ID_Frequency_{w}, Data_Frequency_{w},
+                               Frequency_diff_{w} for each w
+                               e.g. ID_Frequency_0.1s, Data_Frequency_60s
+    """
+    pass
 
 
-def processing(df):
+def processing(df, frequency_backend=FREQUENCY_BACKEND, window_sizes=WINDOW_SIZES,
+               sequence_depth=SEQUENCE_DEPTH):
     """
     Feature extraction pipeline for raw CAN bus log data.
     
@@ -15,6 +50,18 @@ def processing(df):
     Output columns: Arbitration_ID, DLC, Label,
                     Prev_Interver, ID_Prev_Interver, Data_Prev_Interver,
                     ID_Frequency, Data_Frequency, Frequency_diff
+
+    frequency_backend selects how step 5 is computed:
+      'rolling'      : pandas time-based rolling per group (reference)
+      'searchsorted' : window_counts() over sorted NumPy arrays (bit-identical)
+
+    window_sizes lists the step-5 windows; column names from frequency_columns().
+
+    sequence_depth > 0 adds SEQUENCE_COLS (step 5b) computed over the last
+    sequence_depth frames of each Arbitration_ID.
+
+    Each numbered step runs inside instrument.stage(f"processing.{n}_{step}")
+    so the timing report breaks processing() down per step.
     """
 
     # 1. Label Encoding
@@ -26,11 +73,13 @@ def processing(df):
     #    Fill missing Data values with '00'
     #    Parse space-separated hex bytes into a single integer
     #    e.g., "40 B2 81" → 0x40B281 → int
+    #    Bulk path: decode_hex_columns(df) — whole column at once, no per-row int(x, 16)
     pass
 
     # 3. Arbitration ID Conversion
     #    Convert hex string to integer
     #    e.g., "7FF" → 2047
+    #    (decoded together with Data by decode_hex_columns())
     pass
 
     # 4. Time Interval Features
@@ -38,6 +87,9 @@ def processing(df):
     #    ID_Prev_Interver   : time elapsed since the previous frame with the same Arbitration_ID
     #    Data_Prev_Interver : time elapsed since the previous frame with the same (ID, Data) pair
     #    Fill NaN (first occurrence) with TIME_SIZE
+    #
+    #    If Prev_Interver is already present (set by main() before per-bus
+    #    sharding), keep it — the global interval spans all buses of a file
     pass
 
     # 5. Rolling Frequency Features
@@ -47,6 +99,21 @@ def processing(df):
     #    Data_Frequency : count of frames with the same (ID, Data) pair within WINDOW_SIZE
     #    Frequency_diff : ID_Frequency - Data_Frequency
     #                     (measures how many IDs share the same data pattern)
+    #
+    #    frequency_backend == 'searchsorted':
+    #      ID_Frequency   = window_counts(Arbitration_ID, DateTime, window_sizes)
+    #      Data_Frequency = window_counts((Arbitration_ID, Data), DateTime, window_sizes)
+    #      One sort per key, one searchsorted per window
+    #    frequency_backend == 'rolling':
+    #      one rolling(w).count() per window in window_sizes
+    #
+    #    Columns are named by frequency_columns(window_sizes)
+    pass
+
+    # 5b. Payload Sequence Features (sequence_depth > 0 only)
+    #    sequence_features(df, sequence_depth) → SEQUENCE_COLS
+    #    Needs the payload bytes: step 2 runs decode_hex_columns(byte_columns=True)
+    #    BYTE_COLS are dropped again in step 6
     pass
 
     # 6. Cleanup
@@ -57,13 +124,400 @@ def processing(df):
     return df
 
 
-def main():
+def decode_hex_columns(df, byte_columns=False):
+    """
+    Bulk decode of Data and Arbitration_ID (steps 2 and 3) over byte buffers.
+
+    Data ("40 B2 81 14", up to 8 bytes → at most 23 characters):
+      1. Fill missing Data with '00'
+      2. buf = df['Data'].to_numpy('S23').view(np.uint8).reshape(-1, 23)
+           fixed-width, NUL-padded ASCII matrix — one row per frame
+      3. nib = HEX_LUT[buf]
+           HEX_LUT: 256-entry uint8 table, '0'–'9' / 'A'–'F' / 'a'–'f' → 0–15
+      4. bytes_ = nib[:, 0::3] << 4 | nib[:, 1::3]      → (n, 8) uint8
+         n_bytes = (length of each string + 1) // 3     → handles variable DLC
+         positions >= n_bytes are zeroed
+      5. Data = big-endian pack of the first n_bytes bytes → uint64
+           e.g. "40 B2 81" → 0x40B281, identical to int("40B281", 16)
+
+    Arbitration_ID ("7FF", "329"):
+      6. Same LUT over to_numpy('S8'); Horner accumulate hex digits
+         left to right, masked by each string's length → uint32
+
+    byte_columns=True additionally adds BYTE_COLS (Byte_0 … Byte_7, uint8)
+    from step 4, left-aligned with 0 for bytes beyond n_bytes, so later
+    stages do not need to re-parse the payload string.
+
+    Returns df with Data / Arbitration_ID as integers.
+    """
+    pass
+
+
+class PayloadRing:
+    """
+    Fixed-size ring buffer of the last N payloads of one Arbitration_ID.
+
+      payloads : uint64[N]   the frame's BYTE_COLS (left-aligned, zero-padded)
+                             viewed as one little-endian uint64 — not the
+                             right-aligned Data integer
+      hamming  : uint8[N]    Payload_Hamming of the same frames
+      head     : next write slot; count = min(frames seen, N)
+
+    Per frame, update(bytes_) takes the 8 BYTE_COLS values (uint8) and
+    returns the SEQUENCE_COLS values:
+      payload         = bytes_.view('<u8')
+      Payload_Hamming = popcount(payload ^ previous)        (0 for the first frame)
+      Bytes_Changed   = count of differing bytes (xor, per-byte != 0)
+      Hamming_Mean    = running sum of hamming[] / count   (sum updated O(1))
+      Payload_Repeat  = (payloads[:count] == payload).sum()
+      Sequence_Repeat = any k with payloads[k] == previous and
+                        payloads[k+1] == payload (k+1 still inside the ring)
+    then overwrites payloads[head] / hamming[head] and advances head.
+
+    Using BYTE_COLS keeps the values equal to sequence_features() when DLC
+    varies: "40 B2" and "40 B2 00" are the same left-aligned bytes, while
+    their Data integers (0x40B2 / 0x40B200) differ in every bit position.
+
+    Memory is N × 9 bytes per ID; work per frame is O(N) with N fixed,
+    so total cost is linear in the number of frames.
+    """
+
+    def __init__(self, depth):
+        pass
+
+    def update(self, bytes_):
+        pass
+
+
+def sequence_features(df, depth=SEQUENCE_DEPTH):
+    """
+    Step 5b: payload sequence features per Arbitration_ID.
+
+    Frames are walked once in capture order; each Arbitration_ID owns a
+    PayloadRing(depth) in a dict. Batch path, same values without a
+    Python loop per frame:
+      1. order = stable argsort by Arbitration_ID (original order within ID)
+      2. Ring contents at row i are the lags 1..depth of i inside its ID
+         group → depth shifted views of the sorted payload array, masked
+         where the lag crosses a group start
+      3. All features compare the left-aligned BYTE_COLS (viewed as one
+         uint64 per row, the same payload PayloadRing stores) — never the
+         right-aligned Data integer:
+         Hamming via np.bitwise_count (NumPy >= 2.0) or a 256-entry
+         popcount table over the 8 bytes; Bytes_Changed, Payload_Repeat
+         and Sequence_Repeat on the same uint64 values
+      4. Scatter back to original row order
+    Cost is O(depth × n) with depth fixed.
+    Returns df with SEQUENCE_COLS added.
+    """
+    pass
+
+
+def window_counts(keys, timestamps, window_sizes=WINDOW_SIZES):
+    """
+    Vectorized per-key rolling count, equal to
+    df.groupby(keys).rolling(w).count() on a DateTime index for each w.
+
+    keys         : array (or tuple of arrays) identifying the group of each row
+    timestamps   : datetime64[ns] values of the DateTime column
+    window_sizes : list of windows; all share one sort
+    Returns float64 counts of shape (n_rows, len(window_sizes)), aligned
+    with the input rows.
+
+    Steps:
+      1. Convert timestamps and window to int64 nanoseconds — the same
+         integers pandas rolling compares, so window edges match exactly
+      2. Factorize keys → key codes (0 … n_keys-1, n_keys <= n)
+      3. order = np.lexsort((np.arange(n), ts, codes))
+           stable: rows with equal (key, ts) keep their original order
+      4. Replace timestamps by global ranks and make every key one
+         contiguous ascending run:
+           ts_sorted = np.sort(ts)
+           rank      = np.searchsorted(ts_sorted, ts, side='right')   (0 … n)
+           packed    = codes * (n + 1) + rank                          (int64)
+         Ranks are monotone in ts, and packed < (n + 1)² — no overflow for
+         any capture size and any number of distinct (ID, Data) codes, so
+         there is no per-key fallback.
+      5. For each window w (the sorts above are shared — the only O(n log n) steps):
+           lo    = codes * (n + 1) + np.searchsorted(ts_sorted, ts - w, side='right')
+           left  = np.searchsorted(packed[order], lo[order], side='right')
+           count = np.arange(n) - left + 1
+             → frames of the key with rank > rank(t - w), i.e. timestamp in
+               (t - w, t] — same right-closed window as rolling
+      6. Scatter counts back to the original row order; cast to float64
+    """
+    pass
+
+
+# ── Streaming Engine ─────────────────────────────────────────
+
+class StreamingFeatureEngine:
+    """
+    Single-pass, per-frame equivalent of processing() steps 1–6.
+
+    Frames are consumed one at a time in timestamp order. All state is
+    keyed, so memory is bounded by the number of distinct keys and by
+    the number of frames inside one WINDOW_SIZE — not by capture length.
+
+    State:
+      last_ts        : timestamp of the previous frame (global)
+      last_id_ts     : {Arbitration_ID: last timestamp}
+      last_data_ts   : {(Arbitration_ID, Data): last timestamp}
+      id_window      : {Arbitration_ID: deque of timestamps in window}
+      data_window    : {(Arbitration_ID, Data): deque of timestamps in window}
+      rings          : {Arbitration_ID: PayloadRing}   (sequence_depth > 0)
+
+    Output per frame (same columns and order as processing()):
+      Arbitration_ID, DLC, Label,
+      Prev_Interver, ID_Prev_Interver, Data_Prev_Interver,
+      ID_Frequency, Data_Frequency, Frequency_diff
+      + SEQUENCE_COLS when sequence_depth > 0
+    """
+
+    def __init__(self, time_size=TIME_SIZE, window_sizes=WINDOW_SIZES,
+                 sequence_depth=SEQUENCE_DEPTH):
+        # window_sizes are parsed once into int64 nanoseconds (pd.Timedelta(...).value);
+        # window deques hold ns timestamps, as pandas rolling compares them
+        # One deque holds the largest window; smaller windows keep a per-window
+        # left pointer into it, so a frame is stored once for all windows
+        # Initialise the five state containers listed above (dicts of deques)
+        # sequence_depth > 0: rings = {Arbitration_ID: PayloadRing(sequence_depth)}
+        pass
+
+    def update(self, frame):
+        """
+        Consume one raw frame and return its feature row.
+
+        frame: mapping with Interface, Timestamp, Arbitration_ID, DLC, Data, Label
+
+        Steps (mirrors processing()):
+          1.   Label encoding (same mapping as processing() step 1)
+          2–3. Data / Arbitration_ID hex → int (missing Data → '00')
+          4.   Intervals = t − last-seen time per key; first occurrence → TIME_SIZE
+               then update last_ts / last_id_ts / last_data_ts
+          5.   Append t to id_window[id] and data_window[(id, data)]
+               Pop from the left while timestamp <= t − window  (int64 ns)
+                 → same closed='right' window as pandas rolling(WINDOW_SIZE)
+               ID_Frequency   = len(id_window[id])
+               Data_Frequency = len(data_window[(id, data)])
+               Frequency_diff = ID_Frequency − Data_Frequency
+               (per window: deque length minus that window's left pointer)
+               Frequencies are emitted as float to match rolling().count()
+          5b.  sequence_depth > 0: rings[id].update(bytes_), bytes_ the
+               left-aligned payload bytes from step 2
+               → SEQUENCE_COLS (same values as sequence_features())
+          6.   Interface / Timestamp / Data are not emitted
+        """
+        pass
+
+    def process(self, frames):
+        """
+        Generator over an iterable of raw frames (e.g. csv.DictReader rows
+        or DataFrame.itertuples()). Yields one feature row per frame.
+        """
+        pass
+
+
+def processing_stream(frames, time_size=TIME_SIZE, window_sizes=WINDOW_SIZES,
+                      sequence_depth=SEQUENCE_DEPTH):
+    """
+    Drop-in streaming counterpart of processing().
+
+    Walks frames once in timestamp order through a
+    StreamingFeatureEngine(time_size, window_sizes, sequence_depth) and returns the feature rows as a DataFrame with processing()'s columns.
+    Input must already be sorted by Timestamp (raw captures are).
+
+    NOTE: last_data_ts keeps one entry per distinct (ID, Data) pair, so on
+    Fuzzing-heavy captures memory grows with payload diversity. Entries
+    cannot be evicted without changing Data_Prev_Interver.
+    """
+    pass
+
+
+def verify_streaming(df, sequence_depth=SEQUENCE_DEPTH):
+    """
+    Equivalence check between processing() and processing_stream().
+
+      expected = processing(df.copy(), sequence_depth=sequence_depth)
+      actual   = processing_stream(df.itertuples(), sequence_depth=sequence_depth)
+      pd.testing.assert_frame_equal(expected, actual, check_exact=True)
+
+    Run on synthetic CAN traffic (ids_pseudocode/synthetic) with multiple
+    buses, repeated payloads, equal timestamps and gaps longer than WINDOW_SIZE.
+    """
+    pass
+
+
+# ── Chunked Mode ─────────────────────────────────────────────
+
+class ChunkCarry:
+    """
+    State carried from one chunk to the next in processing_chunked().
+
+      last_ts      : timestamp of the last frame of the previous chunk
+      last_id_ts   : {Arbitration_ID: last timestamp}
+      last_data_ts : {(Arbitration_ID, Data): last timestamp}
+      tail         : raw frames with Timestamp > last_ts − max(WINDOW_SIZES)
+                     (the trailing window; covers every key's frequency window)
+      rings        : {Arbitration_ID: PayloadRing(sequence_depth)} when
+                     sequence_depth > 0 (the last N frames of an ID may lie
+                     outside the tail)
+
+    Size is bounded by the largest window of frames plus one entry per key.
+    """
+
+    def __init__(self, sequence_depth=SEQUENCE_DEPTH):
+        # Empty dicts / empty tail; last_ts = None; rings only if sequence_depth > 0
+        pass
+
+    def update(self, ext):
+        """
+        Refresh the carry from the extended chunk (tail + chunk):
+          - last_ts         ← ext.Timestamp.iloc[-1]
+          - last-seen dicts are merged, never replaced:
+              last_id_ts.update(ext.groupby('Arbitration_ID')['Timestamp'].last().to_dict())
+              last_data_ts.update(ext.groupby(['Arbitration_ID', 'Data'])['Timestamp'].last().to_dict())
+            A key absent from this chunk keeps its older entry, so its next
+            occurrence gets the real interval instead of TIME_SIZE
+          - tail            ← rows of ext with Timestamp > ext.Timestamp.max() − max(WINDOW_SIZES)
+          - rings           ← fed the chunk rows' BYTE_COLS per Arbitration_ID
+                              (sequence_depth > 0)
+        """
+        pass
+
+
+def process_chunk(chunk, carry, frequency_backend=FREQUENCY_BACKEND,
+                  sequence_depth=SEQUENCE_DEPTH):
+    """
+    Featurize one raw chunk so that its rows equal whole-file processing().
+
+    1. ext = concat([carry.tail, chunk]); mark tail rows
+    2. Run processing() steps 1–5b on ext with sequence_depth
+       (Timestamp and BYTE_COLS kept until step 6)
+         → ID_Frequency / Data_Frequency are exact for chunk rows, because
+           every frame inside their window is in ext
+    3. Fix intervals of the first ext occurrence per key using the carry:
+         Prev_Interver      ← t − carry.last_ts
+         ID_Prev_Interver   ← t − carry.last_id_ts[id]          (if present)
+         Data_Prev_Interver ← t − carry.last_data_ts[(id, data)] (if present)
+       Keys never seen before keep TIME_SIZE
+       SEQUENCE_COLS: lags that cross the chunk start are read from carry.rings
+    4. carry.update(ext)
+    5. Drop tail rows, apply step 6 cleanup, return the chunk's features
+    """
+    pass
+
+
+def processing_chunked(csv_path, chunk_size=CHUNK_SIZE, frequency_backend=FREQUENCY_BACKEND,
+                       sequence_depth=SEQUENCE_DEPTH):
+    """
+    Out-of-core processing() for one raw label CSV.
+
+    carry = ChunkCarry(sequence_depth)
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_size, dtype=RAW_DTYPES):
+        yield process_chunk(chunk, carry, frequency_backend, sequence_depth)
+
+    dtype=RAW_DTYPES keeps Arbitration_ID / Data as hex strings in every
+    chunk, so a chunk whose values happen to be all digits is not parsed as
+    decimal integers. The carry starts empty for every file. Peak memory is one chunk plus
+    tail of the largest window plus the per-key dicts — independent of file size.
+    """
+    pass
+
+
+# ── Parallel Sharding ────────────────────────────────────────
+
+def make_shards(df, file_idx):
+    """
+    Split one raw label file into independent work units.
+
+    1. Compute Prev_Interver on the whole file (global diff, filled with
+       TIME_SIZE) so it is not cut at bus boundaries
+    2. Keep the original row position in a '_row' column
+    3. If the Arbitration_ID sets of the buses are disjoint, return one
+       shard per Interface — all per-ID / per-(ID, Data) state then lives
+       inside a single bus
+       Otherwise return the whole file as one shard, since processing()
+       groups a shared ID across buses
+
+    Returns a list of (file_idx, shard_df).
+    """
+    pass
+
+
+def process_shard(shard, sequence_depth=SEQUENCE_DEPTH):
+    """
+    Worker entry point: run processing(shard_df, sequence_depth=sequence_depth)
+    on one (file_idx, shard_df). main() binds sequence_depth with
+    functools.partial before pool.map.
+    Returns (file_idx, processed_df, records) with '_row' preserved;
+    records = instrument.RECORDER.drain(), the worker's processing.* stages
+    (the pool process never writes a report of its own).
+    """
+    pass
+
+
+def merge_shards(results):
+    """
+    Deterministic merge of process_shard() results.
+
+    Sort by (file_idx, _row), drop '_row', reset index — restores the exact
+    row order of the serial run regardless of worker completion order.
+    Each result's records go to instrument.RECORDER.extend(records,
+    prefix=f"shard.{file_idx}"), so the parent's report has every step.
+    """
+    pass
+
+
+# ── Output ───────────────────────────────────────────────────
+
+def save_proc(df, path, output_format=OUTPUT_FORMAT, writer=None):
+    """
+    Save a processed split.
+
+    writer: open incremental writer for chunked mode — rows are appended
+            (CSV: mode='a', header only on the first chunk;
+             Parquet: one row group per chunk via pyarrow.parquet.ParquetWriter)
+
+    'csv'     : df.to_csv(f"{path}.csv", index=False)        (original format)
+    'parquet' : df.astype(proc_dtypes(df.columns))
+                  (suffixed frequency windows → uint32; absent columns skipped)
+                → f"{path}.parquet"
+                  - pyarrow engine, one row group per ~1M rows
+                  - uncompressed, so readers can memory-map the file
+                  - Interface (if still present) stored as a dictionary column
+
+    NOTE: float32 intervals round the float64 values in the CSV output.
+    Arbitration_ID as uint16 covers standard 11-bit IDs only.
+    """
+    pass
+
+
+# ── Main ─────────────────────────────────────────────────────
+
+def main(workers=1, output_format=OUTPUT_FORMAT, chunk_size=CHUNK_SIZE,
+         sequence_depth=SEQUENCE_DEPTH, profile=False):
     """
     Load raw train/test label CSVs, apply processing(), and save as proc.csv files.
 
     Input  : dataset/.../Interface/{train,test}/*labels.csv
     Output : source/AutoHack/train_proc.csv
              source/AutoHack/test_proc.csv
+
+    workers > 1 runs processing() on per-file / per-bus shards in a
+    ProcessPoolExecutor; the merged output is byte-identical to workers=1.
+
+    output_format='parquet' writes {split}_proc.parquet via save_proc().
+
+    sequence_depth (step 5b) reaches every path: processing() (serial),
+    process_shard() (workers), processing_chunked() (chunk_size), so all
+    three produce the same SEQUENCE_COLS.
+
+    chunk_size reads each raw file in chunks through processing_chunked()
+    and appends every processed chunk to the split output immediately.
+
+    Every run writes report/timing/preprocessing_{timestamp}.json
+    (instrument.write_report); profile=True also dumps a cProfile .prof.
     """
 
     program_path = os.getcwd()
@@ -79,18 +533,48 @@ def main():
 
     for path in path_list:
         # Collect all label CSV files in the split directory
+        #   sorted() so file order — and therefore output order — is fixed
         pass
 
         # Process each label file and store results
-        #   - Load CSV
-        #   - Apply processing()
-        #   - Append to file_data dict
+        #   workers == 1:
+        #     - Load CSV (pd.read_csv(file, dtype=RAW_DTYPES))
+        #     - Apply processing(df, sequence_depth=sequence_depth)
+        #     - Append to file_data dict
+        #   workers > 1:
+        #     - Load CSV → make_shards(df, file_idx)
+        #     - ProcessPoolExecutor(max_workers=workers).map(
+        #           partial(process_shard, sequence_depth=sequence_depth), shards)
+        #     - merge_shards(results)
+        #   chunk_size set:
+        #     - for chunk_df in processing_chunked(file, chunk_size,
+        #                                          sequence_depth=sequence_depth):
+        #           save_proc(chunk_df, {split}_proc, output_format, writer)
+        #     - nothing is kept in file_data
         pass
 
         # Concatenate all processed files and save
-        #   → {split}_proc.csv  (e.g., train_proc.csv)
+        #   → save_proc(df, {split}_proc, output_format)
+        #     (e.g., train_proc.csv / train_proc.parquet)
         pass
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="AutoHack CAN log preprocessing")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="process-pool size for per-file / per-bus shards (1 = serial)")
+    parser.add_argument("--format", choices=["csv", "parquet"], default=OUTPUT_FORMAT,
+                        help="output format for {split}_proc files")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help="rows per chunk for out-of-core processing (default: whole file)")
+    parser.add_argument("--sequence-depth", type=int, default=SEQUENCE_DEPTH,
+                        help="add payload sequence features over the last N frames per ID (0 = off)")
+    parser.add_argument("--profile", action="store_true",
+                        help="dump a cProfile .prof next to the timing report")
+    args = parser.parse_args()
+
+    if args.chunk_size and args.workers > 1:
+        parser.error("--chunk-size and --workers are mutually exclusive")
+
+    main(workers=args.workers, output_format=args.format, chunk_size=args.chunk_size,
+         sequence_depth=args.sequence_depth, profile=args.profile)